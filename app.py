@@ -6,34 +6,77 @@ Main application launcher
 
 import sys
 import os
+import json
+import functools
+import importlib.util
 from pathlib import Path
 
-# Add the project root to Python path
+# Add the project root to Python path unless it is already there (running
+# app.py as a script puts its directory at sys.path[0])
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if os.path.abspath(project_root) not in {os.path.abspath(entry) for entry in sys.path}:
+    sys.path.insert(0, str(project_root))
 
+# Keep the real main window and startup signal relay alive after _post_paint_init
+_main_window = None
+_startup_notifier = None
+
+@functools.lru_cache(maxsize=1)
 def check_dependencies():
     """Check if required dependencies are installed"""
-    try:
-        import PySide6
-        print("✓ PySide6 is available")
-    except ImportError:
+    # find_spec locates the packages without executing their import code
+    if importlib.util.find_spec('PySide6') is None:
         print("✗ PySide6 is not installed. Please run: pip install PySide6")
         return False
+    print("✓ PySide6 is available")
         
-    try:
-        import requests
-        print("✓ requests is available")
-    except ImportError:
+    if importlib.util.find_spec('requests') is None:
         print("✗ requests is not installed. Please run: pip install requests")
         return False
+    print("✓ requests is available")
         
     return True
 
+def _cached_sqlmap_path():
+    """
+    Get the sqlmap path saved in config.json by setup.py
+    
+    Returns:
+        str: The saved path if it still exists, otherwise None
+    """
+    try:
+        with open(project_root / "config.json", 'r', encoding='utf-8') as f:
+            sqlmap_path = json.load(f).get('sqlmap_path')
+    except (OSError, ValueError, AttributeError):
+        return None
+        
+    if sqlmap_path and os.path.exists(sqlmap_path):
+        return sqlmap_path
+    return None
+
+def _first_existing_path(paths):
+    """
+    Return the first path in paths that is an existing file
+    
+    Args:
+        paths (list): Candidate file paths, in priority order
+        
+    Returns:
+        str: First existing path, or None
+    """
+    return next((path for path in paths if os.path.isfile(path)), None)
+
+@functools.lru_cache(maxsize=1)
 def check_sqlmap():
-    """Check if sqlmap is available"""
+    """Check if sqlmap is available (result is cached for the process lifetime)"""
     import shutil
     
+    # Reuse the path recorded by setup.py when it is still valid
+    sqlmap_path = _cached_sqlmap_path()
+    if sqlmap_path:
+        print(f"✓ sqlmap found at: {sqlmap_path}")
+        return True
+    
     sqlmap_path = shutil.which('sqlmap')
     if sqlmap_path:
         print(f"✓ sqlmap found at: {sqlmap_path}")
@@ -61,10 +104,10 @@ def check_sqlmap():
                 os.path.join(exe_dir, '..', 'sqlmap', 'sqlmap.py'),
             ])
         
-        for path in possible_paths:
-            if os.path.exists(path):
-                print(f"✓ sqlmap.py found at: {path}")
-                return True
+        path = _first_existing_path(possible_paths)
+        if path:
+            print(f"✓ sqlmap.py found at: {path}")
+            return True
         
         print("✗ sqlmap not found. Please install sqlmap or place sqlmap.py in the project directory")
         return False
@@ -74,8 +117,9 @@ def main():
     print("SQLmapper - Desktop GUI for sqlmap")
     print("=" * 50)
     
-    # Check if we're running in windowed mode (PyInstaller)
-    is_windowed = getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')
+    # Check if we're running in windowed mode (PyInstaller, or pythonw
+    # from the Windows launcher) where there is no console to prompt on
+    is_windowed = (getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS')) or sys.stdin is None
     
     # Check dependencies
     if not check_dependencies():
@@ -88,103 +132,205 @@ def main():
             input("Press Enter to exit...")
             sys.exit(1)
         
-    # Check sqlmap
-    if not check_sqlmap():
+    # Check sqlmap. In windowed mode there is no one to ask, so the check
+    # is left to a worker thread once the window is up (_post_paint_init),
+    # which reports a missing sqlmap in a message box.
+    if not is_windowed and not check_sqlmap():
         print("\nWarning: sqlmap not found. The application may not work properly.")
-        if is_windowed:
-            # In windowed mode, continue anyway since we can't ask user
-            print("Continuing anyway in windowed mode...")
-        else:
-            response = input("Continue anyway? (y/N): ")
-            if response.lower() != 'y':
-                sys.exit(1)
+        response = input("Continue anyway? (y/N): ")
+        if response.lower() != 'y':
+            sys.exit(1)
     
     print("\nStarting SQLmapper...")
     
     try:
-        from PySide6.QtWidgets import QApplication, QMessageBox
-        from PySide6.QtCore import Qt
+        from PySide6.QtCore import QTimer
+        
+        # Get a window on screen first, then do the heavy lifting
+        app, placeholder = _pre_paint()
+        QTimer.singleShot(0, lambda: _post_paint_init(app, placeholder, is_windowed))
+        
+        # Start event loop
+        sys.exit(app.exec())
+        
+    except ImportError as e:
+        print(f"✗ Import error: {e}")
+        print("Please ensure all dependencies are installed correctly.")
+        if not is_windowed:
+            input("Press Enter to exit...")
+        sys.exit(1)
+    except Exception as e:
+        print(f"✗ Error starting application: {e}")
+        if not is_windowed:
+            input("Press Enter to exit...")
+        sys.exit(1)
+
+
+def _pre_paint():
+    """
+    Create the QApplication and show a lightweight placeholder window
+    
+    Only the minimum Qt imports happen here so that first paint is not
+    blocked on the full sqlmapper GUI import chain.
+    
+    Returns:
+        tuple: (QApplication, placeholder QMainWindow)
+    """
+    from PySide6.QtWidgets import QApplication, QMainWindow, QLabel
+    from PySide6.QtCore import Qt
+    
+    # Create QApplication
+    app = QApplication(sys.argv)
+    app.setApplicationName("SQLmapper")
+    app.setApplicationVersion("1.0.0")
+    app.setOrganizationName("SQLmapper")
+    
+    # Set application style
+    app.setStyle('Fusion')
+    
+    placeholder = QMainWindow()
+    placeholder.setWindowTitle("SQLmapper - Desktop GUI for sqlmap")
+    loading_label = QLabel("Loading SQLmapper...")
+    loading_label.setAlignment(Qt.AlignCenter)
+    placeholder.setCentralWidget(loading_label)
+    placeholder.resize(400, 150)
+    placeholder.show()
+    
+    return app, placeholder
+
+
+def _post_paint_init(app, placeholder, is_windowed):
+    """
+    Finish startup once the event loop is running
+    
+    Sets up logging and swaps the placeholder for the real main window.
+    The windowed-mode sqlmap check and the icon decode run on worker
+    threads and report back to the GUI thread through Qt signals.
+    
+    Args:
+        app (QApplication): Running application
+        placeholder (QMainWindow): Window shown by _pre_paint
+        is_windowed (bool): True when running as a windowed executable
+    """
+    global _main_window, _startup_notifier
+    
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        from PySide6.QtCore import QObject, Signal
         from sqlmapper.gui.main_window import MainWindow
         from sqlmapper.utils.logger import setup_logging
         
+        class StartupNotifier(QObject):
+            """Relays background startup results to the GUI thread"""
+            sqlmap_checked = Signal(bool)
+            icon_loaded = Signal(object)
+        
         # Setup logging
         setup_logging()
         
-        # Create QApplication
-        app = QApplication(sys.argv)
-        app.setApplicationName("SQLmapper")
-        app.setApplicationVersion("1.0.0")
-        app.setOrganizationName("SQLmapper")
-        
-        # Set application style
-        app.setStyle('Fusion')
-        
-        # Show sqlmap warning in windowed mode if needed
-        if is_windowed and not check_sqlmap():
-            QMessageBox.warning(
-                None,
-                "SQLmap Warning",
-                "SQLmap not found. The application may not work properly.\n\n"
-                "Please ensure sqlmap.py is in the parent directory (H:\\sqlmap\\sqlmap.py).\n\n"
-                "The executable should be in H:\\sqlmap\\sqlmapper\\dist\\"
-            )
+        # Create and show main window in place of the placeholder
+        _main_window = MainWindow()
+        _main_window.show()
+        placeholder.close()
         
-        # Set application icon
-        try:
-            from PySide6.QtGui import QIcon, QPixmap
-            from PySide6.QtCore import Qt
-            
-            # Try logo.ico first, then logo.png
-            logo_paths = [project_root / "logo.ico", project_root / "logo.png"]
-            icon_loaded = False
-            
-            for logo_path in logo_paths:
-                if logo_path.exists():
-                    if logo_path.suffix.lower() == '.ico':
-                        # Load ICO file directly
-                        icon = QIcon(str(logo_path))
-                        app.setWindowIcon(icon)
-                        print("✓ Application icon loaded successfully")
-                        icon_loaded = True
-                        break
-                    else:
-                        # Load PNG image
-                        pixmap = QPixmap(str(logo_path))
-                        if not pixmap.isNull():
-                            # Scale to appropriate size if needed
-                            if pixmap.width() > 64 or pixmap.height() > 64:
-                                pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                            
-                            icon = QIcon(pixmap)
-                            app.setWindowIcon(icon)
-                            print("✓ Application icon loaded successfully")
-                            icon_loaded = True
-                            break
-            
-            if not icon_loaded:
-                print("⚠ No logo file found (logo.ico or logo.png)")
-        except Exception as e:
-            print(f"Could not set application icon: {e}")
+        # Run the remaining checks off the GUI thread; signals emitted from
+        # the workers are queued onto the GUI thread
+        _startup_notifier = StartupNotifier()
+        _startup_notifier.icon_loaded.connect(lambda source: _apply_application_icon(app, source))
+        _startup_notifier.sqlmap_checked.connect(_on_sqlmap_checked)
         
-        # Create and show main window
-        main_window = MainWindow()
-        main_window.show()
+        executor = ThreadPoolExecutor(max_workers=2)
+        executor.submit(_load_icon_source).add_done_callback(
+            lambda future: _startup_notifier.icon_loaded.emit(future.result())
+        )
+        if is_windowed:
+            executor.submit(check_sqlmap).add_done_callback(
+                lambda future: _startup_notifier.sqlmap_checked.emit(future.result())
+            )
+        executor.shutdown(wait=False)
         
         print("✓ SQLmapper GUI started successfully!")
         print("✓ Custom arguments feature available in Advanced tab")
         
-        # Start event loop
-        sys.exit(app.exec())
-        
-    except ImportError as e:
-        print(f"✗ Import error: {e}")
-        print("Please ensure all dependencies are installed correctly.")
-        input("Press Enter to exit...")
-        sys.exit(1)
     except Exception as e:
         print(f"✗ Error starting application: {e}")
-        input("Press Enter to exit...")
-        sys.exit(1)
+        app.exit(1)
+
+
+def _on_sqlmap_checked(found):
+    """Show the windowed-mode sqlmap warning if sqlmap was not found"""
+    if found:
+        return
+        
+    from PySide6.QtWidgets import QMessageBox
+    QMessageBox.warning(
+        _main_window,
+        "SQLmap Warning",
+        "SQLmap not found. The application may not work properly.\n\n"
+        "Please ensure sqlmap.py is in the parent directory (H:\\sqlmap\\sqlmap.py).\n\n"
+        "The executable should be in H:\\sqlmap\\sqlmapper\\dist\\"
+    )
+
+
+def _load_icon_source():
+    """
+    Locate and decode the application logo
+    
+    Only QImage is used here so this is safe to run off the GUI thread.
+    
+    Returns:
+        str or QImage: Path to logo.ico, the decoded logo.png, or None
+    """
+    try:
+        from PySide6.QtGui import QImageReader
+        from PySide6.QtCore import Qt, QSize
+        
+        # Try logo.ico first, then logo.png
+        ico_path = project_root / "logo.ico"
+        if ico_path.exists():
+            return str(ico_path)
+            
+        png_path = project_root / "logo.png"
+        if png_path.exists():
+            reader = QImageReader(str(png_path))
+            # Only oversized images need scaling; the reader decodes them
+            # straight to the target size instead of resampling afterwards
+            size = reader.size()
+            if size.width() > 64 or size.height() > 64:
+                reader.setScaledSize(size.scaled(QSize(64, 64), Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                return image
+    except Exception as e:
+        print(f"Could not load application icon: {e}")
+        
+    return None
+
+
+def _apply_application_icon(app, source):
+    """
+    Set the application icon from the result of _load_icon_source
+    
+    Args:
+        app (QApplication): Running application
+        source (str or QImage): Icon file path or decoded image
+    """
+    if source is None:
+        print("⚠ No logo file found (logo.ico or logo.png)")
+        return
+        
+    try:
+        from PySide6.QtGui import QIcon, QPixmap
+        
+        if isinstance(source, str):
+            # Load ICO file directly
+            icon = QIcon(source)
+        else:
+            icon = QIcon(QPixmap.fromImage(source))
+        app.setWindowIcon(icon)
+        print("✓ Application icon loaded successfully")
+    except Exception as e:
+        print(f"Could not set application icon: {e}")
 
 
 if __name__ == "__main__":
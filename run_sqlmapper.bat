@@ -1,4 +1,3 @@
 @echo off
 cd /d "H:\sqlmapper"
-python app.py %*
-pause
+start "" pythonw app.py %*
@@ -7,11 +7,14 @@ This script automatically detects the operating system and installs SQLMap
 if it's not found in the environment variables or system PATH.
 """
 
+import io
 import os
 import sys
 import platform
+import re
 import subprocess
 import shutil
+import urllib.error
 import urllib.request
 import zipfile
 import tarfile
@@ -21,23 +24,34 @@ from typing import Optional, Tuple
 from setuptools import setup, find_packages
 
 
+# Platform details never change for the lifetime of the process
+_SYSTEM_NAME = platform.system()
+_ARCH = platform.machine().lower()
+
+# Parts of the sqlmap archive that are not needed at runtime
+_SQLMAP_SKIP_PREFIXES = tuple(
+    f"sqlmap-master/{name}/" for name in ("doc", ".github", "tests")
+)
+
+
 class SQLmapperInstaller:
     """Cross-platform installer for SQLmapper and SQLMap"""
     
     def __init__(self):
-        self.system = platform.system().lower()
-        self.arch = platform.machine().lower()
+        self.system = _SYSTEM_NAME.lower()
+        self.arch = _ARCH
         self.python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
-        self.project_root = Path(__file__).parent.absolute()
+        self.project_root = Path(os.path.abspath(os.path.dirname(__file__)))
         self.sqlmap_dir = self.project_root / "sqlmap"
         self.sqlmap_path = None
+        self.sqlmap_etag = None
         
     def print_banner(self):
         """Print installation banner"""
         print("=" * 60)
         print("           SQLmapper Installation Script")
         print("=" * 60)
-        print(f"Platform: {platform.system()} {platform.release()}")
+        print(f"Platform: {_SYSTEM_NAME} {platform.release()}")
         print(f"Architecture: {self.arch}")
         print(f"Python: {self.python_version}")
         print("=" * 60)
@@ -55,6 +69,13 @@ class SQLmapperInstaller:
         """Check if SQLMap is already installed"""
         print("\n🔍 Checking for SQLMap installation...")
         
+        # Reuse the path recorded by a previous installation
+        sqlmap_path = self._cached_sqlmap_path()
+        if sqlmap_path:
+            print(f"✅ SQLMap found from previous installation: {sqlmap_path}")
+            self.sqlmap_path = sqlmap_path
+            return True
+            
         # Check if sqlmap is in PATH
         sqlmap_path = shutil.which('sqlmap')
         if sqlmap_path:
@@ -69,15 +90,26 @@ class SQLmapperInstaller:
             self.sqlmap_path = str(sqlmap_py)
             return True
             
-        # Check if sqlmap directory exists
-        if self.sqlmap_dir.exists() and (self.sqlmap_dir / "sqlmap.py").exists():
-            print(f"✅ SQLMap found in project directory: {self.sqlmap_dir}")
-            self.sqlmap_path = str(self.sqlmap_dir / "sqlmap.py")
-            return True
-            
         print("❌ SQLMap not found")
         return False
         
+    def _cached_sqlmap_path(self) -> Optional[str]:
+        """Get the SQLMap path saved in config.json if it still exists"""
+        sqlmap_path = self._read_config().get('sqlmap_path')
+            
+        if sqlmap_path and os.path.exists(sqlmap_path):
+            return sqlmap_path
+        return None
+        
+    def _read_config(self) -> dict:
+        """Read the installer config.json, returning an empty dict if unavailable"""
+        try:
+            with open(self.project_root / "config.json", 'r') as f:
+                config = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return config if isinstance(config, dict) else {}
+        
     def install_sqlmap(self) -> bool:
         """Install SQLMap based on the operating system"""
         print("\n📦 Installing SQLMap...")
@@ -100,35 +132,8 @@ class SQLmapperInstaller:
         """Install SQLMap on Windows"""
         print("Installing SQLMap for Windows...")
         
-        # Create sqlmap directory
-        self.sqlmap_dir.mkdir(exist_ok=True)
-        
-        # Download SQLMap
-        sqlmap_url = "https://github.com/sqlmapproject/sqlmap/archive/master.zip"
-        zip_path = self.sqlmap_dir / "sqlmap-master.zip"
-        
         try:
-            print("Downloading SQLMap from GitHub...")
-            urllib.request.urlretrieve(sqlmap_url, zip_path)
-            
-            # Extract zip file
-            print("Extracting SQLMap...")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.sqlmap_dir)
-            
-            # Move contents to sqlmap directory
-            extracted_dir = self.sqlmap_dir / "sqlmap-master"
-            if extracted_dir.exists():
-                for item in extracted_dir.iterdir():
-                    dest = self.sqlmap_dir / item.name
-                    if item.is_dir():
-                        shutil.copytree(item, dest, dirs_exist_ok=True)
-                    else:
-                        shutil.copy2(item, dest)
-                shutil.rmtree(extracted_dir)
-            
-            # Clean up
-            zip_path.unlink()
+            self._install_sqlmap_archive()
             
             # Set sqlmap path
             self.sqlmap_path = str(self.sqlmap_dir / "sqlmap.py")
@@ -237,30 +242,7 @@ class SQLmapperInstaller:
             
         # Fallback to downloading zip
         try:
-            sqlmap_url = "https://github.com/sqlmapproject/sqlmap/archive/master.zip"
-            zip_path = self.sqlmap_dir / "sqlmap-master.zip"
-            
-            print("Downloading SQLMap from GitHub...")
-            urllib.request.urlretrieve(sqlmap_url, zip_path)
-            
-            # Extract zip file
-            print("Extracting SQLMap...")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.sqlmap_dir)
-            
-            # Move contents to sqlmap directory
-            extracted_dir = self.sqlmap_dir / "sqlmap-master"
-            if extracted_dir.exists():
-                for item in extracted_dir.iterdir():
-                    dest = self.sqlmap_dir / item.name
-                    if item.is_dir():
-                        shutil.copytree(item, dest, dirs_exist_ok=True)
-                    else:
-                        shutil.copy2(item, dest)
-                shutil.rmtree(extracted_dir)
-            
-            # Clean up
-            zip_path.unlink()
+            self._install_sqlmap_archive()
             
             self.sqlmap_path = str(self.sqlmap_dir / "sqlmap.py")
             print("✅ SQLMap installed successfully")
@@ -270,6 +252,90 @@ class SQLmapperInstaller:
             print(f"❌ Manual installation failed: {e}")
             return False
             
+    def _is_archive_install(self) -> bool:
+        """Check if the SQLMap in use is a tree downloaded by _install_sqlmap_archive"""
+        sqlmap_py = self.sqlmap_dir / "sqlmap.py"
+        return (
+            bool(self._read_config().get('sqlmap_etag'))
+            and self.sqlmap_path is not None
+            and Path(self.sqlmap_path) == sqlmap_py
+            and not (self.sqlmap_dir / ".git").exists()
+        )
+        
+    def update_sqlmap_archive(self) -> bool:
+        """
+        Update a SQLMap tree downloaded by an earlier installation
+        
+        The download sends the recorded ETag, so an unchanged archive costs a
+        single request answered with 304 Not Modified.
+        
+        Returns:
+            bool: True if the local copy is current or was updated
+        """
+        print("\n🔄 Checking for SQLMap updates...")
+        
+        try:
+            if self._install_sqlmap_archive():
+                print("✅ SQLMap updated")
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not update SQLMap, keeping the installed copy: {e}")
+            return False
+            
+    def _install_sqlmap_archive(self):
+        """
+        Download the SQLMap zip archive from GitHub into the sqlmap directory
+        
+        Returns:
+            bool: False if the local copy was already up to date
+        """
+        sqlmap_url = "https://github.com/sqlmapproject/sqlmap/archive/master.zip"
+        
+        # Extract into a sibling directory so the tree can be moved with one rename
+        extract_dir = self.sqlmap_dir.parent / ".sqlmap-extract"
+        if extract_dir.exists():
+            shutil.rmtree(extract_dir)
+        extract_dir.mkdir()
+        
+        try:
+            # Ask GitHub to skip the download if the local copy is still current
+            headers = {}
+            etag = self._read_config().get('sqlmap_etag')
+            if etag and (self.sqlmap_dir / "sqlmap.py").exists():
+                headers['If-None-Match'] = etag
+            request = urllib.request.Request(sqlmap_url, headers=headers)
+            
+            # Download into memory rather than writing the archive to disk
+            print("Downloading SQLMap from GitHub...")
+            archive = io.BytesIO()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    shutil.copyfileobj(response, archive)
+                    self.sqlmap_etag = response.headers.get('ETag')
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    print("SQLMap is already up to date")
+                    self.sqlmap_etag = etag
+                    return False
+                raise
+            
+            # Extract zip file
+            print("Extracting SQLMap...")
+            with zipfile.ZipFile(archive, 'r') as zip_ref:
+                members = [
+                    name for name in zip_ref.namelist()
+                    if not name.startswith(_SQLMAP_SKIP_PREFIXES)
+                ]
+                zip_ref.extractall(extract_dir, members=members)
+            
+            # Move extracted tree into place
+            if self.sqlmap_dir.exists():
+                shutil.rmtree(self.sqlmap_dir)
+            os.replace(extract_dir / "sqlmap-master", self.sqlmap_dir)
+            return True
+        finally:
+            shutil.rmtree(extract_dir, ignore_errors=True)
+            
     def install_python_dependencies(self) -> bool:
         """Install Python dependencies"""
         print("\n📦 Installing Python dependencies...")
@@ -280,12 +346,9 @@ class SQLmapperInstaller:
             return False
             
         try:
-            # Upgrade pip first
-            subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pip"], 
-                         check=True, capture_output=True)
-            
-            # Install requirements
-            subprocess.run([sys.executable, "-m", "pip", "install", "-r", str(requirements_file)], 
+            # Upgrade pip and install requirements in a single pip run
+            subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pip",
+                            "-r", str(requirements_file)],
                          check=True, capture_output=True)
             
             print("✅ Python dependencies installed successfully")
@@ -314,10 +377,14 @@ class SQLmapperInstaller:
             
     def _create_windows_launcher(self):
         """Create Windows batch launcher"""
+        # Launch the GUI with pythonw so no console window is created
+        pythonw = Path(sys.executable).with_name("pythonw.exe")
+        if not pythonw.exists():
+            pythonw = "pythonw"
+            
         launcher_content = f'''@echo off
 cd /d "{self.project_root}"
-python app.py %*
-pause
+start "" "{pythonw}" app.py %*
 '''
         
         launcher_path = self.project_root / "run_sqlmapper.bat"
@@ -347,19 +414,20 @@ python3 app.py "$@"
         
         try:
             config_file = self.project_root / "config.json"
-            config = {}
-            
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
+            config = self._read_config()
             
             # Update SQLMap path
             config['sqlmap_path'] = self.sqlmap_path
+            if self.sqlmap_etag:
+                config['sqlmap_etag'] = self.sqlmap_etag
             config['installation_complete'] = True
             config['install_date'] = str(Path().cwd())
             
-            with open(config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write to a temporary file and rename so a crash never leaves
+            # a half-written config behind
+            tmp_file = config_file.with_suffix('.json.tmp')
+            tmp_file.write_text(json.dumps(config, indent=2), encoding='utf-8')
+            os.replace(tmp_file, config_file)
                 
             print("✅ Configuration updated")
             return True
@@ -388,19 +456,27 @@ python3 app.py "$@"
             
         print(f"✅ SQLMap verified: {self.sqlmap_path}")
         
-        # Test SQLMap
-        try:
-            result = subprocess.run([sys.executable, self.sqlmap_path, "--version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                print("✅ SQLMap is working correctly")
-            else:
-                print("⚠️ SQLMap version check failed, but file exists")
-        except Exception as e:
-            print(f"⚠️ Could not test SQLMap: {e}")
+        # Read the SQLMap version from its settings instead of launching it
+        version = self._read_sqlmap_version()
+        if version:
+            print(f"✅ SQLMap version {version}")
+        else:
+            print("⚠️ Could not determine SQLMap version, but file exists")
             
         return True
         
+    def _read_sqlmap_version(self) -> Optional[str]:
+        """Read VERSION from lib/core/settings.py next to the SQLMap script"""
+        settings_file = Path(self.sqlmap_path).parent / "lib" / "core" / "settings.py"
+        try:
+            with open(settings_file, 'r', encoding='utf-8', errors='replace') as f:
+                head = f.read(8192)
+        except OSError:
+            return None
+            
+        match = re.search(r'^VERSION\s*=\s*["\']([^"\']+)["\']', head, re.MULTILINE)
+        return match.group(1) if match else None
+        
     def print_usage_instructions(self):
         """Print usage instructions"""
         print("\n" + "=" * 60)
@@ -437,6 +513,11 @@ python3 app.py "$@"
         # Check if SQLMap is already installed
         if self.check_sqlmap_installed():
             print("\n✅ SQLMap is already installed")
+            
+            # A copy downloaded by an earlier run is refreshed; the download
+            # only happens if the archive changed since then
+            if self._is_archive_install():
+                self.update_sqlmap_archive()
         else:
             # Install SQLMap
             if not self.install_sqlmap():
@@ -489,76 +570,71 @@ def main():
         sys.exit(1)
 
 
-# Read the README file for long description
-this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding='utf-8')
+def run_setup():
+    """Run setuptools for packaging commands (pip install, egg_info, ...)"""
+    # Read the README file for long description
+    this_directory = Path(__file__).parent
+    long_description = (this_directory / "README.md").read_text(encoding='utf-8')
 
-# Read requirements
-requirements = []
-with open('requirements.txt', 'r', encoding='utf-8') as f:
-    for line in f:
-        line = line.strip()
-        if line and not line.startswith('#'):
-            requirements.append(line)
-
-# Setup configuration
-setup(
-    name="sqlmapper",
-    version="1.0.0",
-    author="SQLmapper Team",
-    author_email="contact@sqlmapper.dev",
-    description="A desktop GUI application for sqlmap, similar to Zenmap for nmap",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/sqlmapper/sqlmapper",
-    project_urls={
-        "Bug Reports": "https://github.com/sqlmapper/sqlmapper/issues",
-        "Source": "https://github.com/sqlmapper/sqlmapper",
-        "Documentation": "https://github.com/sqlmapper/sqlmapper/wiki",
-    },
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Information Technology",
-        "Intended Audience :: System Administrators",
-        "Topic :: Security",
-        "Topic :: Security :: Tools",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Operating System :: OS Independent",
-        "Environment :: X11 Applications :: Qt",
-        "Environment :: Win32 (MS Windows)",
-        "Environment :: MacOS X",
-    ],
-    python_requires=">=3.8",
-    install_requires=requirements,
-    entry_points={
-        "console_scripts": [
-            "sqlmapper=app:main",
-        ],
-        "gui_scripts": [
-            "sqlmapper-gui=app:main",
+    # Setup configuration
+    setup(
+        name="sqlmapper",
+        version="1.0.0",
+        author="SQLmapper Team",
+        author_email="contact@sqlmapper.dev",
+        description="A desktop GUI application for sqlmap, similar to Zenmap for nmap",
+        long_description=long_description,
+        long_description_content_type="text/markdown",
+        url="https://github.com/sqlmapper/sqlmapper",
+        project_urls={
+            "Bug Reports": "https://github.com/sqlmapper/sqlmapper/issues",
+            "Source": "https://github.com/sqlmapper/sqlmapper",
+            "Documentation": "https://github.com/sqlmapper/sqlmapper/wiki",
+        },
+        packages=find_packages(),
+        classifiers=[
+            "Development Status :: 4 - Beta",
+            "Intended Audience :: Information Technology",
+            "Intended Audience :: System Administrators",
+            "Topic :: Security",
+            "Topic :: Security :: Tools",
+            "License :: OSI Approved :: MIT License",
+            "Programming Language :: Python :: 3",
+            "Programming Language :: Python :: 3.8",
+            "Programming Language :: Python :: 3.9",
+            "Programming Language :: Python :: 3.10",
+            "Programming Language :: Python :: 3.11",
+            "Programming Language :: Python :: 3.12",
+            "Operating System :: OS Independent",
+            "Environment :: X11 Applications :: Qt",
+            "Environment :: Win32 (MS Windows)",
+            "Environment :: MacOS X",
         ],
-    },
-    include_package_data=True,
-    package_data={
-        "sqlmapper": [
-            "*.png",
-            "*.ico",
-            "*.qss",
-            "data/*",
-            "templates/*",
-        ],
-    },
-    keywords="sqlmap, gui, security, penetration-testing, sql-injection, cybersecurity",
-    zip_safe=False,
-)
+        entry_points={
+            "console_scripts": [
+                "sqlmapper=app:main",
+            ],
+            "gui_scripts": [
+                "sqlmapper-gui=app:main",
+            ],
+        },
+        include_package_data=True,
+        package_data={
+            "sqlmapper": [
+                "*.png",
+                "*.ico",
+                "*.qss",
+                "data/*",
+                "templates/*",
+            ],
+        },
+        keywords="sqlmap, gui, security, penetration-testing, sql-injection, cybersecurity",
+        zip_safe=False,
+    )
 
 
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) == 1:
+    # Plain "python setup.py" runs the interactive installer
     main()
+else:
+    run_setup()
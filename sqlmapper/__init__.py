@@ -14,18 +14,41 @@ __author__ = "SQLmapper Team"
 __email__ = "contact@sqlmapper.dev"
 __license__ = "MIT"
 
-# Import main components for easy access
-from .gui.main_window import MainWindow
-from .core.command_builder import CommandBuilder
-from .core.subprocess_runner import SubprocessRunner
-from .utils.config import Config
-from .utils.logger import setup_logging, get_logger
-
-__all__ = [
-    "MainWindow",
-    "CommandBuilder", 
-    "SubprocessRunner",
-    "Config",
-    "setup_logging",
-    "get_logger",
-]
+import importlib
+import sys
+from typing import TYPE_CHECKING
+
+# Main components are resolved lazily (PEP 562) so that importing the
+# package does not pull in PySide6 unless a GUI/Qt component is requested
+_LAZY_IMPORTS = {
+    "MainWindow": ("sqlmapper.gui.main_window", "MainWindow"),
+    "CommandBuilder": ("sqlmapper.core.command_builder", "CommandBuilder"),
+    "SubprocessRunner": ("sqlmapper.core.subprocess_runner", "SubprocessRunner"),
+    "Config": ("sqlmapper.utils.config", "Config"),
+    "setup_logging": ("sqlmapper.utils.logger", "setup_logging"),
+    "get_logger": ("sqlmapper.utils.logger", "get_logger"),
+}
+
+if TYPE_CHECKING:
+    from .gui.main_window import MainWindow
+    from .core.command_builder import CommandBuilder
+    from .core.subprocess_runner import SubprocessRunner
+    from .utils.config import Config
+    from .utils.logger import setup_logging, get_logger
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    """Import main components on first access"""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
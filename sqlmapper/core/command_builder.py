@@ -2,8 +2,299 @@
 Command builder for constructing sqlmap command line arguments
 """
 
+import functools
+import os
 import shlex
-from typing import Dict, List, Any
+import shutil
+import stat
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+
+# Marks the sqlmap path cache as not yet resolved
+_UNRESOLVED = object()
+
+# Resolved sqlmap path, shared by all CommandBuilder instances. A failed
+# search caches the 'sqlmap' fallback too, so it is not repeated.
+_sqlmap_path_cache: Any = _UNRESOLVED
+
+
+def _resolve_sqlmap_path() -> str:
+    """
+    Find sqlmap executable path, caching the result
+    
+    Returns:
+        str: Path to sqlmap executable
+    """
+    global _sqlmap_path_cache
+    
+    if _sqlmap_path_cache is _UNRESOLVED:
+        sqlmap_path = _find_sqlmap()
+        if sqlmap_path:
+            # Store an absolute path so relative candidates like
+            # '../sqlmap.py' are resolved once and survive cwd changes
+            _sqlmap_path_cache = os.path.abspath(sqlmap_path)
+        else:
+            # Default fallback
+            _sqlmap_path_cache = 'sqlmap'
+        
+    return _sqlmap_path_cache
+
+
+def _find_sqlmap() -> Optional[str]:
+    """
+    Search the usual locations for sqlmap
+    
+    Returns:
+        str: Path to sqlmap executable, or None if not found
+    """
+    # Check if we're running from PyInstaller bundle
+    if getattr(sys, 'frozen', False):
+        # Running from executable - sqlmap should be in parent directory
+        # The executable is in H:\sqlmap\sqlmapper\dist\SQLmapper.exe
+        # So sqlmap.py should be in H:\sqlmap\sqlmap.py
+        current_dir = os.path.dirname(sys.executable)
+        # Go up to sqlmap directory
+        sqlmap_dir = os.path.dirname(os.path.dirname(current_dir))
+        sqlmap_path = os.path.join(sqlmap_dir, 'sqlmap.py')
+        if os.path.exists(sqlmap_path):
+            return sqlmap_path
+    
+    # Try to find sqlmap in PATH
+    sqlmap_path = shutil.which('sqlmap')
+    if sqlmap_path:
+        return sqlmap_path
+        
+    # Try common locations: ./sqlmap.py, ../sqlmap.py, then sqlmap/sqlmap.py.
+    # Each directory is listed once instead of stat-ing every candidate.
+    cwd_entries = _list_directory(os.curdir)
+    
+    entry = cwd_entries.get('sqlmap.py')
+    if entry is not None and entry.is_file():
+        return 'sqlmap.py'
+        
+    entry = _list_directory(os.pardir).get('sqlmap.py')
+    if entry is not None and entry.is_file():
+        return '../sqlmap.py'
+        
+    entry = cwd_entries.get('sqlmap')
+    if entry is not None and entry.is_dir() and _is_executable('sqlmap/sqlmap.py'):
+        return 'sqlmap/sqlmap.py'
+            
+    return None
+
+
+def _list_directory(path: str) -> Dict[str, Any]:
+    """
+    List a directory with a single os.scandir call
+    
+    Args:
+        path (str): Directory to list
+        
+    Returns:
+        dict: Entry name to os.DirEntry (empty if the directory is unreadable)
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _is_executable(path: str) -> bool:
+    """
+    Check if a path is executable
+    
+    Args:
+        path (str): Path to check
+        
+    Returns:
+        bool: True if executable
+    """
+    # A single stat answers both "is it a file" and "is it executable"
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if not stat.S_ISREG(st.st_mode):
+        return False
+    # For Python files, just check if file exists
+    if path.endswith('.py'):
+        return True
+    # For other files, check if executable
+    return bool(st.st_mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
+
+
+# Detection option name to sqlmap flag
+_DETECTION_MAP: Mapping[str, str] = MappingProxyType({
+    'banner': '--banner',
+    'current_user': '--current-user',
+    'current_db': '--current-db',
+    'hostname': '--hostname',
+    'is_dba': '--is-dba',
+    'users': '--users',
+    'passwords': '--passwords',
+    'privileges': '--privileges',
+    'roles': '--roles',
+    'dbs': '--dbs',
+    'tables': '--tables',
+    'columns': '--columns',
+    'schema': '--schema'
+})
+
+# Injection technique letters accepted by sqlmap
+_VALID_TECHNIQUES = frozenset('BEUSTQ')
+
+# (key, minimum, maximum, error message) for integer options
+_INT_RANGE_RULES = (
+    ('risk_level', 1, 3, "Risk level must be between 1 and 3"),
+    ('level', 1, 5, "Level must be between 1 and 5"),
+    ('threads', 1, 10, "Threads must be between 1 and 10"),
+    ('timeout', 1, 300, "Timeout must be between 1 and 300 seconds"),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _split_custom_args(custom_args: str) -> Tuple[str, ...]:
+    """
+    Split a custom arguments string into individual arguments
+    
+    Args:
+        custom_args (str): Arguments as typed by the user
+        
+    Returns:
+        tuple: Arguments (a tuple so the cached result cannot be modified)
+    """
+    custom_args = custom_args.strip()
+    if not custom_args:
+        return ()
+        
+    # Split by spaces but preserve quoted arguments
+    try:
+        return tuple(shlex.split(custom_args))
+    except ValueError:
+        # If shlex fails, fall back to simple split
+        return tuple(custom_args.split())
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Snapshot a target/options value for comparison with a later call
+    
+    Dicts and lists are copied into tuples so later changes to the caller's
+    objects cannot alter the snapshot. Scalars keep their type, since equal
+    values such as 1, 1.0 and True format differently.
+    """
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return (type(value), value)
+
+
+# Argument emitters used by the flag tables below. Each takes the sqlmap
+# flag, the value from the input dict and the whole input dict, and returns
+# the arguments to add.
+
+def _emit_value(flag: str, value: Any, values: Dict[str, Any]) -> List[str]:
+    """Flag followed by the value"""
+    return [flag, f'{value}']
+
+
+def _emit_switch(flag: str, value: Any, values: Dict[str, Any]) -> List[str]:
+    """Flag alone, only if the value is truthy"""
+    return [flag] if value else []
+
+
+def _emit_techniques(flag: str, value: Any, values: Dict[str, Any]) -> List[str]:
+    """Technique letters joined into one value, if any are selected"""
+    return [flag, ''.join(value)] if value else []
+
+
+def _emit_headers(flag: str, value: Any, values: Dict[str, Any]) -> List[str]:
+    """Headers as one "Name: value" line each, from a dict or text as-is"""
+    if isinstance(value, dict):
+        if not value:
+            return []
+        value = '\n'.join(f'{name}: {header}' for name, header in value.items())
+    return [flag, f'{value}']
+
+
+def _emit_detection(flag: str, value: Any, values: Dict[str, Any]) -> List[str]:
+    """One flag per known detection option"""
+    return [_DETECTION_MAP[detection] for detection in value if detection in _DETECTION_MAP]
+
+
+def _emit_tor(flag: str, value: Any, values: Dict[str, Any]) -> List[str]:
+    """Tor switch, followed by the Tor port when one is given"""
+    if not value:
+        return []
+    tor_port = values.get('tor_port', _MISSING)
+    if tor_port is not _MISSING:
+        return [flag, '--tor-port', f'{tor_port}']
+    return [flag]
+
+
+def _emit_positive(flag: str, value: Any, values: Dict[str, Any]) -> List[str]:
+    """Flag followed by the value, only if the value is greater than zero"""
+    return [flag, f'{value}'] if value > 0 else []
+
+
+# Marks a key that is absent from the target/options dict
+_MISSING = object()
+
+
+def _emit_args(table: Tuple, values: Dict[str, Any]) -> List[str]:
+    """
+    Build arguments for every table entry whose key is present in values
+    
+    Args:
+        table (tuple): (key, flag, emitter) entries
+        values (dict): Target or options dict
+        
+    Returns:
+        list: Arguments in table order
+    """
+    args = []
+    for key, flag, emit in table:
+        # One lookup per key instead of an "in" test followed by indexing
+        value = values.get(key, _MISSING)
+        if value is not _MISSING:
+            args.extend(emit(flag, value, values))
+    return args
+
+
+# (key, flag, emitter) in the order the arguments appear on the command line
+_TARGET_FLAGS = (
+    ('url', '-u', _emit_value),
+    ('request_file', '-r', _emit_value),
+    ('data', '--data', _emit_value),
+    ('cookies', '--cookie', _emit_value),
+    ('headers', '--headers', _emit_headers),
+    ('random_user_agent', '--random-agent', _emit_switch),
+)
+
+_OPTION_FLAGS = (
+    ('risk_level', '--risk', _emit_value),
+    ('level', '--level', _emit_value),
+    ('threads', '--threads', _emit_value),
+    ('timeout', '--timeout', _emit_value),
+    ('retries', '--retries', _emit_value),
+    ('techniques', '--technique', _emit_techniques),
+    ('dbms', '--dbms', _emit_value),
+    ('detection', None, _emit_detection),
+    ('proxy', '--proxy', _emit_value),
+    ('tor', '--tor', _emit_tor),
+    ('delay', '--delay', _emit_positive),
+    ('skip_url_encode', '--skip-url-encode', _emit_switch),
+    ('skip_static', '--skip-static', _emit_switch),
+    ('tamper', '--tamper', _emit_value),
+    ('os', '--os', _emit_value),
+    # Skip WAF detection (valid sqlmap option)
+    ('skip_waf', '--skip-waf', _emit_switch),
+    ('fresh_queries', '--fresh-queries', _emit_switch),
+)
 
 
 class CommandBuilder:
@@ -15,48 +306,47 @@ class CommandBuilder:
         """Initialize the command builder"""
         self.sqlmap_path = self.find_sqlmap()
         
+        # Last build_command() inputs and result
+        self._last_key = None
+        self._last_cmd = None
+        
+    @property
+    def sqlmap_path(self) -> str:
+        """Path to the sqlmap executable or script"""
+        return self._sqlmap_path
+        
+    @sqlmap_path.setter
+    def sqlmap_path(self, path: str):
+        self._sqlmap_path = path
+        
+        # Work out the interpreter prefix once rather than on every build
+        if path.endswith('.py'):
+            # When running from PyInstaller bundle, use the bundled Python
+            if getattr(sys, 'frozen', False):
+                # Use the same Python executable that's running this app
+                self._cmd_prefix = (sys.executable, path)
+            else:
+                self._cmd_prefix = ('python', path)
+        else:
+            self._cmd_prefix = (path,)
+            
+    @classmethod
+    def reset_sqlmap_cache(cls):
+        """Forget the cached sqlmap path so the next lookup searches again"""
+        global _sqlmap_path_cache
+        _sqlmap_path_cache = _UNRESOLVED
+        
     def find_sqlmap(self) -> str:
         """
         Find sqlmap executable path
         
+        The path is resolved once and shared by all instances; see
+        reset_sqlmap_cache() to force a new search.
+        
         Returns:
             str: Path to sqlmap executable
         """
-        import shutil
-        import sys
-        import os
-        
-        # Check if we're running from PyInstaller bundle
-        if getattr(sys, 'frozen', False):
-            # Running from executable - sqlmap should be in parent directory
-            # The executable is in H:\sqlmap\sqlmapper\dist\SQLmapper.exe
-            # So sqlmap.py should be in H:\sqlmap\sqlmap.py
-            current_dir = os.path.dirname(sys.executable)
-            # Go up to sqlmap directory
-            sqlmap_dir = os.path.dirname(os.path.dirname(current_dir))
-            sqlmap_path = os.path.join(sqlmap_dir, 'sqlmap.py')
-            if os.path.exists(sqlmap_path):
-                return sqlmap_path
-        
-        # Try to find sqlmap in PATH
-        sqlmap_path = shutil.which('sqlmap')
-        if sqlmap_path:
-            return sqlmap_path
-            
-        # Try common locations
-        common_paths = [
-            'sqlmap.py',
-            './sqlmap.py',
-            '../sqlmap.py',
-            'sqlmap/sqlmap.py'
-        ]
-        
-        for path in common_paths:
-            if self._is_executable(path):
-                return path
-                
-        # Default fallback
-        return 'sqlmap'
+        return _resolve_sqlmap_path()
         
     def _is_executable(self, path: str) -> bool:
         """
@@ -68,14 +358,7 @@ class CommandBuilder:
         Returns:
             bool: True if executable
         """
-        import os
-        if os.path.isfile(path):
-            # For Python files, just check if file exists
-            if path.endswith('.py'):
-                return True
-            # For other files, check if executable
-            return os.access(path, os.X_OK)
-        return False
+        return _is_executable(path)
         
     def build_command(self, target: Dict[str, Any], options: Dict[str, Any]) -> List[str]:
         """
@@ -88,18 +371,12 @@ class CommandBuilder:
         Returns:
             list: Command arguments
         """
-        import sys
-        
-        # Check if sqlmap_path is a Python script
-        if self.sqlmap_path.endswith('.py'):
-            # When running from PyInstaller bundle, use the bundled Python
-            if getattr(sys, 'frozen', False):
-                # Use the same Python executable that's running this app
-                cmd = [sys.executable, self.sqlmap_path]
-            else:
-                cmd = ['python', self.sqlmap_path]
-        else:
-            cmd = [self.sqlmap_path]
+        # Reuse the previous command when nothing has changed
+        key = (self._cmd_prefix, _freeze(target), _freeze(options))
+        if key == self._last_key:
+            return list(self._last_cmd)
+            
+        cmd = list(self._cmd_prefix)
         
         # Add target
         cmd.extend(self._build_target_args(target))
@@ -107,6 +384,8 @@ class CommandBuilder:
         # Add options
         cmd.extend(self._build_option_args(options))
         
+        self._last_key = key
+        self._last_cmd = tuple(cmd)
         return cmd
         
     def _build_target_args(self, target: Dict[str, Any]) -> List[str]:
@@ -119,33 +398,7 @@ class CommandBuilder:
         Returns:
             list: Target arguments
         """
-        args = []
-        
-        # URL target
-        if 'url' in target:
-            args.extend(['-u', target['url']])
-            
-        # Request file
-        if 'request_file' in target:
-            args.extend(['-r', target['request_file']])
-            
-        # POST data
-        if 'data' in target:
-            args.extend(['--data', target['data']])
-            
-        # Cookies
-        if 'cookies' in target:
-            args.extend(['--cookie', target['cookies']])
-            
-        # Headers
-        if 'headers' in target:
-            args.extend(['--headers', target['headers']])
-            
-        # Random user agent
-        if target.get('random_user_agent'):
-            args.append('--random-agent')
-            
-        return args
+        return _emit_args(_TARGET_FLAGS, target)
         
     def _build_option_args(self, options: Dict[str, Any]) -> List[str]:
         """
@@ -157,116 +410,17 @@ class CommandBuilder:
         Returns:
             list: Option arguments
         """
-        args = []
-        
-        # Risk level
-        if 'risk_level' in options:
-            args.extend(['--risk', str(options['risk_level'])])
-            
-        # Level
-        if 'level' in options:
-            args.extend(['--level', str(options['level'])])
-            
-        # Threads
-        if 'threads' in options:
-            args.extend(['--threads', str(options['threads'])])
-            
-        # Timeout
-        if 'timeout' in options:
-            args.extend(['--timeout', str(options['timeout'])])
-            
-        # Retries
-        if 'retries' in options:
-            args.extend(['--retries', str(options['retries'])])
-            
-        # Techniques
-        if 'techniques' in options and options['techniques']:
-            techniques = ''.join(options['techniques'])
-            args.extend(['--technique', techniques])
-            
-        # DBMS
-        if 'dbms' in options:
-            args.extend(['--dbms', options['dbms']])
-            
-        # Detection options
-        if 'detection' in options:
-            detection_map = {
-                'banner': '--banner',
-                'current_user': '--current-user',
-                'current_db': '--current-db',
-                'hostname': '--hostname',
-                'is_dba': '--is-dba',
-                'users': '--users',
-                'passwords': '--passwords',
-                'privileges': '--privileges',
-                'roles': '--roles',
-                'dbs': '--dbs',
-                'tables': '--tables',
-                'columns': '--columns',
-                'schema': '--schema'
-            }
-            
-            for detection in options['detection']:
-                if detection in detection_map:
-                    args.append(detection_map[detection])
-                
-        # Proxy
-        if 'proxy' in options:
-            args.extend(['--proxy', options['proxy']])
-            
-        # Tor
-        if options.get('tor'):
-            args.append('--tor')
-            if 'tor_port' in options:
-                args.extend(['--tor-port', str(options['tor_port'])])
-                
-        # Delay
-        if 'delay' in options and options['delay'] > 0:
-            args.extend(['--delay', str(options['delay'])])
-            
-        # Skip options
-        if options.get('skip_url_encode'):
-            args.append('--skip-url-encode')
-            
-        if options.get('skip_static'):
-            args.append('--skip-static')
-            
-        # Tamper scripts
-        if 'tamper' in options:
-            args.extend(['--tamper', options['tamper']])
-            
-        # OS
-        if 'os' in options:
-            args.extend(['--os', options['os']])
-            
-        # Batch mode
-        if options.get('batch'):
-            args.append('--batch')
-            
-        # Skip WAF detection (valid sqlmap option)
-        if options.get('skip_waf'):
-            args.append('--skip-waf')
-            
-        # Fresh queries
-        if options.get('fresh_queries'):
-            args.append('--fresh-queries')
-            
-        # Always add batch mode for non-interactive operation
-        if not any('--batch' in arg for arg in args):
-            args.append('--batch')
+        args = _emit_args(_OPTION_FLAGS, options)
             
         # Custom arguments
-        if 'custom_args' in options:
-            custom_args = options['custom_args'].strip()
-            if custom_args:
-                # Split by spaces but preserve quoted arguments
-                import shlex
-                try:
-                    custom_args_list = shlex.split(custom_args)
-                    args.extend(custom_args_list)
-                except ValueError:
-                    # If shlex fails, fall back to simple split
-                    args.extend(custom_args.split())
+        custom_args = options.get('custom_args')
+        custom_args_list = _split_custom_args(custom_args) if custom_args is not None else ()
+                    
+        # Always add batch mode for non-interactive operation, right before
+        # the custom arguments unless they already include it
+        if '--batch' not in custom_args_list:
+            args.append('--batch')
+        args.extend(custom_args_list)
             
         return args
         
@@ -282,7 +436,7 @@ class CommandBuilder:
             str: Command string
         """
         cmd = self.build_command(target, options)
-        return ' '.join(shlex.quote(arg) for arg in cmd)
+        return shlex.join(cmd)
         
     def validate_target(self, target: Dict[str, Any]) -> List[str]:
         """
@@ -308,7 +462,6 @@ class CommandBuilder:
                 
         # Validate request file
         if 'request_file' in target:
-            import os
             if not os.path.isfile(target['request_file']):
                 errors.append("Request file does not exist")
                 
@@ -326,36 +479,22 @@ class CommandBuilder:
         """
         errors = []
         
-        # Validate risk level
-        if 'risk_level' in options:
-            risk = options['risk_level']
-            if not isinstance(risk, int) or risk < 1 or risk > 3:
-                errors.append("Risk level must be between 1 and 3")
-                
-        # Validate level
-        if 'level' in options:
-            level = options['level']
-            if not isinstance(level, int) or level < 1 or level > 5:
-                errors.append("Level must be between 1 and 5")
-                
-        # Validate threads
-        if 'threads' in options:
-            threads = options['threads']
-            if not isinstance(threads, int) or threads < 1 or threads > 10:
-                errors.append("Threads must be between 1 and 10")
-                
-        # Validate timeout
-        if 'timeout' in options:
-            timeout = options['timeout']
-            if not isinstance(timeout, int) or timeout < 1 or timeout > 300:
-                errors.append("Timeout must be between 1 and 300 seconds")
+        # Validate integer ranges
+        for key, low, high, message in _INT_RANGE_RULES:
+            if key in options:
+                value = options[key]
+                if not isinstance(value, int) or not low <= value <= high:
+                    errors.append(message)
                 
         # Validate techniques
         if 'techniques' in options:
             techniques = options['techniques']
-            valid_techniques = ['B', 'E', 'U', 'S', 'T', 'Q']
-            for technique in techniques:
-                if technique not in valid_techniques:
-                    errors.append(f"Invalid technique: {technique}")
+            # One set check covers the usual all-valid case; only walk the
+            # list (keeping the input order) when something is invalid
+            if not _VALID_TECHNIQUES.issuperset(techniques):
+                errors.extend(
+                    f"Invalid technique: {technique}"
+                    for technique in techniques if technique not in _VALID_TECHNIQUES
+                )
                     
         return errors
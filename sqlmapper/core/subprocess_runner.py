@@ -2,6 +2,9 @@
 Subprocess runner for executing sqlmap commands
 """
 
+import locale
+import re
+import selectors
 import subprocess
 import threading
 import queue
@@ -11,22 +14,249 @@ from typing import List, Dict, Any, Optional
 from PySide6.QtCore import QThread, Signal, QObject
 
 
+# Output line handlers used by SubprocessRunner._parse_lines. Each takes the
+# output line, the offset just past the matched message, the result fields
+# and the parse state (current section, vulnerabilities and database info)
+# and updates them in place. Values are sliced from that offset rather than
+# found again by splitting the whole line. Handlers that can only mark the
+# scan vulnerable skip their checks once it already is.
+
+def _on_dbms(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] the back-end DBMS is MySQL"""
+    dbms = line[end:].strip()
+    result['dbms'] = dbms
+    state['database_info']['dbms'] = dbms
+
+
+def _on_banner(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] banner: '...'"""
+    state['database_info']['banner'] = line[end:].strip()
+
+
+def _on_injectable(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """sqlmap identified the following injection point(s):"""
+    result['vulnerable'] = True
+    state['section'] = 'vulnerability'
+
+
+def _on_not_injectable(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[CRITICAL] all tested parameters appear to be not injectable"""
+    result['vulnerable'] = False
+    state['section'] = 'not_vulnerable'
+
+
+def _on_payload(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[PAYLOAD] line inside the injection point(s) section"""
+    if state['section'] == 'vulnerability' and 'Parameter:' in line:
+        param = line.split('Parameter: ')[-1].split()[0]
+        state['vulnerabilities'].append({
+            'parameter': param,
+            'type': 'Unknown',
+            'title': 'SQL Injection',
+            'payload': line
+        })
+
+
+def _on_testing_parameter(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] testing for SQL injection on Parameter: ..."""
+    if not result['vulnerable'] and line.find('Parameter:', end) != -1:
+        result['vulnerable'] = True
+
+
+def _on_fetch_databases(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] fetching database names"""
+    state['section'] = 'databases'
+
+
+def _on_fetch_tables(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] fetching tables for database: 'name'"""
+    db_name = line[end:].strip().strip("'\"")
+    databases = state['database_info'].setdefault('databases', {})
+    if db_name not in databases:
+        databases[db_name] = {'tables': []}
+
+
+def _on_fetch_columns(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] fetching columns for table 'name' in database 'name'"""
+    table_name, in_database, db_name = line[end:].partition(' in database')
+    if in_database:
+        table_name = table_name.strip().strip("'\"")
+        db_name = db_name.strip().strip("'\"")
+        databases = state['database_info'].setdefault('databases', {})
+        tables = databases.setdefault(db_name, {'tables': []})['tables']
+        if table_name not in tables:
+            tables.append(table_name)
+
+
+def _on_fetch_user(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] fetching current user"""
+    state['section'] = 'user_info'
+
+
+def _on_fetch_version(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] fetching database server version"""
+    state['section'] = 'version_info'
+
+
+# database_info key for a retrieved value, by the section it was fetched in
+_RETRIEVED_KEYS = {
+    'user_info': 'current_user',
+    'version_info': 'version',
+}
+
+
+def _on_retrieved(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] retrieved: value, stored according to the current section"""
+    key = _RETRIEVED_KEYS.get(state['section'])
+    if key is not None:
+        state['database_info'][key] = line[end:].strip()
+        
+    # Any retrieved value means data was extracted through an injection
+    result['vulnerable'] = True
+
+
+def _on_no_injection(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] no injection point(s) found"""
+    result['vulnerable'] = False
+
+
+def _on_confirming(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] confirming that the parameter ... is injectable"""
+    if not result['vulnerable'] and line.find('is injectable', end) != -1:
+        result['vulnerable'] = True
+
+
+def _on_parameter(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] parameter ... is vulnerable"""
+    if not result['vulnerable'] and line.find('is vulnerable', end) != -1:
+        result['vulnerable'] = True
+
+
+def _on_found_total(line: str, end: int, result: Dict[str, Any], state: Dict[str, Any]):
+    """[INFO] found a total of N injection point(s)"""
+    if not result['vulnerable'] and line.find('injection point(s)', end) != -1:
+        result['vulnerable'] = True
+
+
+# (event, tag, message, handler) in matching priority order. The tag is the
+# bracketed level sqlmap prints before the message; an empty message matches
+# the tag alone.
+_LINE_EVENTS = (
+    ('dbms', 'INFO', r'the back-end DBMS is', _on_dbms),
+    ('banner', 'INFO', r'banner:', _on_banner),
+    ('critical_injectable', 'CRITICAL', r'sqlmap identified the following injection point\(s\):',
+     _on_injectable),
+    ('not_injectable', 'CRITICAL', r'all tested parameters appear to be not injectable',
+     _on_not_injectable),
+    ('injectable', 'INFO', r'sqlmap identified the following injection point\(s\):', _on_injectable),
+    ('payload', 'PAYLOAD', r'', _on_payload),
+    ('testing_parameter', 'INFO', r'testing for SQL injection on', _on_testing_parameter),
+    ('fetch_databases', 'INFO', r'fetching database names', _on_fetch_databases),
+    ('fetch_tables', 'INFO', r'fetching tables for database:', _on_fetch_tables),
+    ('fetch_columns', 'INFO', r'fetching columns for table', _on_fetch_columns),
+    ('fetch_user', 'INFO', r'fetching current user', _on_fetch_user),
+    ('fetch_version', 'INFO', r'fetching database server version', _on_fetch_version),
+    ('retrieved', 'INFO', r'retrieved:', _on_retrieved),
+    ('no_injection', 'INFO', r'no injection point\(s\) found', _on_no_injection),
+    ('confirming', 'INFO', r'confirming that the parameter', _on_confirming),
+    ('parameter', 'INFO', r'parameter', _on_parameter),
+    ('found_total', 'INFO', r'found a total of', _on_found_total),
+)
+
+
+def _compile_line_pattern(events: tuple) -> re.Pattern:
+    """
+    Combine the event messages into one pattern with a named group per event
+    
+    sqlmap prints each message as '[hh:mm:ss] [TAG] message', so the pattern
+    is anchored there: an optional timestamp, then the tag, then the messages
+    grouped under that tag. Matching only at the start of the line means a
+    line is rejected after its first few characters instead of being scanned
+    to the end.
+    
+    Args:
+        events (tuple): (event, tag, message, handler) entries
+        
+    Returns:
+        re.Pattern: Pattern whose lastgroup names the matched event
+    """
+    messages = {}
+    for event, tag, message, _ in events:
+        messages.setdefault(tag, []).append((event, message))
+        
+    alternatives = []
+    for tag, tag_messages in messages.items():
+        if len(tag_messages) == 1 and not tag_messages[0][1]:
+            alternatives.append(f'(?P<{tag_messages[0][0]}>{re.escape(tag)}\\])')
+        else:
+            grouped = '|'.join(f'(?P<{event}>{message})' for event, message in tag_messages)
+            alternatives.append(f'{re.escape(tag)}\\] (?:{grouped})')
+            
+    return re.compile(r'(?:\[[0-9:]+\] )?\[(?:' + '|'.join(alternatives) + ')')
+
+
+def _new_parse_state(target: str) -> Dict[str, Any]:
+    """
+    Create the state that output lines are parsed into as they arrive
+    
+    Args:
+        target: Scan target, as given on the command line
+        
+    Returns:
+        dict: Parse state, including the result fields set by the handlers
+    """
+    return {
+        'result': {
+            'target': target,
+            'dbms': 'Unknown',
+            'vulnerable': False,
+        },
+        'section': None,
+        'vulnerabilities': [],
+        'database_info': {},
+    }
+
+
+# Matched at the start of each line in place of a substring test per event
+_LINE_RE = _compile_line_pattern(_LINE_EVENTS)
+
+_DISPATCH = {event: handler for event, _, _, handler in _LINE_EVENTS}
+
+
 class SubprocessRunner(QThread):
     """
     Runs sqlmap as a subprocess and streams output
     """
     
-    output_received = Signal(str)
+    output_received = Signal(list)  # Batch of output lines
     scan_completed = Signal(dict)
     scan_failed = Signal(str)
     
+    # Requested output pipe capacity, and bytes requested from it per read.
+    # A larger pipe lets sqlmap write bursts without blocking, and lets a
+    # single read drain them.
+    PIPE_SIZE = 1 << 20
+    READ_SIZE = PIPE_SIZE
+    
+    # Seconds to wait for output before checking for a stop request
+    POLL_INTERVAL = 0.1
+    
+    # Maximum bytes of output, from the end, carried in the result as raw_output
+    RAW_OUTPUT_LIMIT = 1 << 20
+    
     def __init__(self, command: List[str]):
         super().__init__()
         self.command = command
         self.process = None
         self.running = False
         self.output_queue = queue.Queue()
-        self.output_lines = []  # Store all output for parsing
+        self._raw_output = bytearray()  # Tail of the output as read, for the result
+        # sqlmap writes its output in the locale encoding (cp1252 and the
+        # like on Windows), which a text-mode pipe would also decode with
+        self._encoding = locale.getpreferredencoding(False)
+        # Updated as each line arrives. The target is already on the command
+        # line, so it is taken from there instead of searched for in output.
+        self._parse_state = _new_parse_state(self._target_from_command())
         
     def run(self):
         """Run the subprocess"""
@@ -47,33 +277,84 @@ class SubprocessRunner(QThread):
                     else:
                         env['PYTHONPATH'] = sys._MEIPASS
             
-            # Start subprocess
+            # The pipe size can only be set on Python 3.10+, and only takes
+            # effect where the OS supports resizing pipes (Linux)
+            popen_kwargs = {}
+            if sys.version_info >= (3, 10):
+                popen_kwargs['pipesize'] = self.PIPE_SIZE
+                
+            # Start subprocess. Output is read as raw bytes and split into
+            # lines here, rather than decoded line by line by a text wrapper.
             self.process = subprocess.Popen(
                 self.command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1,
-                env=env
+                bufsize=0,
+                close_fds=True,
+                env=env,
+                **popen_kwargs
             )
             
-            # Stream output
-            while self.running and self.process.poll() is None:
-                line = self.process.stdout.readline()
-                if line:
-                    line_stripped = line.rstrip()
-                    self.output_lines.append(line_stripped)
-                    self.output_received.emit(line_stripped)
+            # Stream output. Where pipes can be waited on (not on Windows),
+            # the wait times out regularly so stop() is noticed promptly
+            # even while sqlmap is quiet.
+            stdout = self.process.stdout
+            fd = stdout.fileno()
+            selector = None
+            if os.name != 'nt':
+                selector = selectors.DefaultSelector()
+                selector.register(fd, selectors.EVENT_READ)
+                
+            # Each read fills the same buffer; only the bytes read are copied
+            # on, into the raw output and the pending line data
+            buffer = bytearray(self.READ_SIZE)
+            view = memoryview(buffer)
+            partial = bytearray()  # Output not yet ending in a line break
+            try:
+                while self.running:
+                    if selector is not None and not selector.select(timeout=self.POLL_INTERVAL):
+                        if self.process.poll() is None:
+                            continue
+                        # sqlmap exited during the wait. What it wrote just
+                        # before exiting is still in the pipe, so only stop
+                        # once nothing is left to read.
+                        if not selector.select(timeout=0):
+                            break
+                        
+                    size = stdout.readinto(buffer)
+                    if not size:
+                        break
+                    chunk = view[:size]
+                    raw_output = self._raw_output
+                    raw_output += chunk
+                    if len(raw_output) > 2 * self.RAW_OUTPUT_LIMIT:
+                        # Only the tail ends up in the result; drop the rest
+                        # in large steps so trimming stays cheap per byte
+                        del raw_output[:-self.RAW_OUTPUT_LIMIT]
                     
+                    # Lines end in '\n', '\r\n' or a bare '\r', which sqlmap
+                    # uses to redraw progress lines such as "retrieved: ..."
+                    partial += chunk
+                    end = max(partial.rfind(b'\n'), partial.rfind(b'\r'))
+                    if end != -1:
+                        # One decode for every complete line in the chunk.
+                        # Blank lines are dropped here, so nothing downstream
+                        # has to strip or skip them again; a '\r\n' split
+                        # across two reads only leaves such a blank line.
+                        lines = partial[:end].decode(self._encoding, 'replace').splitlines()
+                        del partial[:end + 1]
+                        lines = [line for line in map(str.rstrip, lines) if line]
+                        if lines:
+                            self._handle_lines(lines)
+            finally:
+                view.release()
+                if selector is not None:
+                    selector.close()
+                        
             # Get remaining output
-            if self.process.poll() is None:
-                remaining_output = self.process.stdout.read()
-                if remaining_output:
-                    remaining_lines = remaining_output.split('\n')
-                    for line in remaining_lines:
-                        if line.strip():
-                            self.output_lines.append(line.strip())
-                            self.output_received.emit(line.strip())
+            remaining = partial.decode(self._encoding, 'replace').rstrip()
+            if remaining:
+                self._handle_lines([remaining])
                     
             # Wait for process to complete
             return_code = self.process.wait()
@@ -90,6 +371,19 @@ class SubprocessRunner(QThread):
         finally:
             self.running = False
             
+    def _handle_lines(self, lines: List[str]):
+        """
+        Parse and emit lines of output
+        
+        All lines read in one chunk are emitted together, so a burst of output
+        costs one cross-thread signal rather than one per line.
+        
+        Args:
+            lines: Non-blank output lines without trailing whitespace
+        """
+        self._parse_lines(lines)
+        self.output_received.emit(lines)
+        
     def stop(self):
         """Stop the subprocess"""
         self.running = False
@@ -113,6 +407,15 @@ class SubprocessRunner(QThread):
         Returns:
             dict: Parsed results
         """
+        # Only the last RAW_OUTPUT_LIMIT bytes are decoded, starting at a
+        # line boundary, so the GUI thread never receives the full output
+        raw = self._raw_output
+        start = max(len(raw) - self.RAW_OUTPUT_LIMIT, 0)
+        if start:
+            breaks = [i for i in (raw.find(b'\n', start), raw.find(b'\r', start)) if i != -1]
+            if breaks:
+                start = min(breaks) + 1
+            
         result = {
             'status': 'completed',
             'target': 'Unknown',
@@ -121,200 +424,65 @@ class SubprocessRunner(QThread):
             'vulnerabilities': [],
             'database_info': {},
             'summary': 'Scan completed successfully',
-            'raw_output': '\n'.join(self.output_lines),
+            'raw_output': raw[start:].decode(self._encoding, 'replace').replace('\r\n', '\n').replace('\r', '\n'),
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        # Parse the output lines
-        self._parse_sqlmap_output(self.output_lines, result)
+        # The lines were already parsed while streaming
+        self._parse_sqlmap_output(result)
         
         return result
+        
+    def _target_from_command(self) -> str:
+        """
+        Extract the scan target from the command
+        
+        Returns:
+            str: Target URL, or 'Unknown' if the command has none
+        """
+        command = self.command or []
+        for i, arg in enumerate(command):
+            if arg.startswith(('http://', 'https://')):
+                return arg
+            elif arg == '-u' and i + 1 < len(command):
+                return command[i + 1]
+                
+        return 'Unknown'
+        
+    def _parse_lines(self, lines: List[str]):
+        """
+        Parse output lines into the incremental parse state
+        
+        Args:
+            lines: Non-blank output lines without trailing whitespace
+        """
+        # Bound once per batch; most lines match no event, so the loop body
+        # is usually a single pattern match
+        match_line = _LINE_RE.match
+        dispatch = _DISPATCH
+        state = self._parse_state
+        fields = state['result']
+        
+        for line in lines:
+            # One combined pattern finds the event, if any, on this line
+            match = match_line(line)
+            if match is not None:
+                dispatch[match.lastgroup](line, match.end(), fields, state)
     
-    def _parse_sqlmap_output(self, lines: List[str], result: Dict[str, Any]):
+    def _parse_sqlmap_output(self, result: Dict[str, Any]):
         """
-        Parse sqlmap output lines to extract information
+        Fill the result from the state parsed out of the output lines
         
         Args:
-            lines: List of output lines
             result: Result dictionary to update
         """
-        current_section = None
-        vulnerabilities = []
-        database_info = {}
-        target_url = None
+        state = self._parse_state
+        vulnerabilities = state['vulnerabilities']
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Extract target URL from various patterns
-            if '[*] testing connection to the target URL' in line:
-                # Extract URL from line like: [*] testing connection to the target URL: 'http://example.com'
-                if "'" in line:
-                    start = line.find("'") + 1
-                    end = line.rfind("'")
-                    if start > 0 and end > start:
-                        target_url = line[start:end]
-                        result['target'] = target_url
-                        
-            elif '[*] starting at' in line and '[*] ending at' in line:
-                # Extract URL from timing line
-                if target_url:
-                    result['target'] = target_url
-                    
-            elif '[INFO] testing URL' in line:
-                # Extract URL from testing line
-                if "'" in line:
-                    start = line.find("'") + 1
-                    end = line.rfind("'")
-                    if start > 0 and end > start:
-                        result['target'] = line[start:end]
-                        
-            elif '[INFO] testing connection to the target URL' in line:
-                # Alternative pattern
-                if "'" in line:
-                    start = line.find("'") + 1
-                    end = line.rfind("'")
-                    if start > 0 and end > start:
-                        result['target'] = line[start:end]
-            
-            # Extract DBMS information
-            elif '[INFO] the back-end DBMS is' in line:
-                # Extract DBMS from line like: [INFO] the back-end DBMS is MySQL
-                dbms = line.split('is ')[-1].strip()
-                result['dbms'] = dbms
-                database_info['dbms'] = dbms
-                
-            elif '[INFO] banner:' in line:
-                # Extract banner information
-                banner = line.split('banner: ')[-1].strip()
-                database_info['banner'] = banner
-                
-            # Check for vulnerabilities - multiple patterns
-            elif '[CRITICAL] sqlmap identified the following injection point(s):' in line:
-                result['vulnerable'] = True
-                current_section = 'vulnerability'
-                
-            elif '[CRITICAL] all tested parameters appear to be not injectable' in line:
-                result['vulnerable'] = False
-                current_section = 'not_vulnerable'
-                
-            elif '[INFO] sqlmap identified the following injection point(s):' in line:
-                result['vulnerable'] = True
-                current_section = 'vulnerability'
-                
-            elif '[PAYLOAD]' in line and current_section == 'vulnerability':
-                # Extract payload information
-                if 'Parameter:' in line:
-                    param = line.split('Parameter: ')[-1].split()[0]
-                    vuln = {
-                        'parameter': param,
-                        'type': 'Unknown',
-                        'title': 'SQL Injection',
-                        'payload': line
-                    }
-                    vulnerabilities.append(vuln)
-                    
-            elif '[INFO] testing for SQL injection on' in line:
-                # Extract parameter being tested
-                if 'Parameter:' in line:
-                    param = line.split('Parameter: ')[-1].split()[0]
-                    # Check if this parameter was found vulnerable
-                    result['vulnerable'] = True
-                    
-            elif '[INFO] testing' in line and 'injection' in line.lower():
-                # General injection testing
-                if 'Parameter:' in line:
-                    param = line.split('Parameter: ')[-1].split()[0]
-                    # This indicates testing is happening, vulnerability will be determined later
-                    
-            # Extract database information
-            elif '[INFO] fetching database names' in line:
-                current_section = 'databases'
-                
-            elif '[INFO] fetching tables for database:' in line:
-                db_name = line.split('database: ')[-1].strip("'\"")
-                if 'databases' not in database_info:
-                    database_info['databases'] = {}
-                if db_name not in database_info['databases']:
-                    database_info['databases'][db_name] = {'tables': []}
-                    
-            elif '[INFO] fetching columns for table' in line:
-                # Extract table name
-                if 'table ' in line and 'database' in line:
-                    table_info = line.split('table ')[-1]
-                    if ' in database' in table_info:
-                        table_name = table_info.split(' in database')[0].strip("'\"")
-                        db_name = table_info.split('database ')[-1].strip("'\"")
-                        if 'databases' not in database_info:
-                            database_info['databases'] = {}
-                        if db_name not in database_info['databases']:
-                            database_info['databases'][db_name] = {'tables': []}
-                        if table_name not in database_info['databases'][db_name]['tables']:
-                            database_info['databases'][db_name]['tables'].append(table_name)
-                            
-            # Extract current user
-            elif '[INFO] fetching current user' in line:
-                current_section = 'user_info'
-                
-            elif '[INFO] retrieved:' in line and current_section == 'user_info':
-                user_info = line.split('retrieved: ')[-1].strip()
-                database_info['current_user'] = user_info
-                
-            # Extract version information
-            elif '[INFO] fetching database server version' in line:
-                current_section = 'version_info'
-                
-            elif '[INFO] retrieved:' in line and current_section == 'version_info':
-                version_info = line.split('retrieved: ')[-1].strip()
-                database_info['version'] = version_info
-                
-            # Check for successful data extraction
-            elif '[INFO] retrieved:' in line:
-                # This indicates successful data extraction
-                if not result['vulnerable']:
-                    result['vulnerable'] = True
-                    
-            # Extract summary information
-            elif '[INFO] sqlmap identified the following injection point(s):' in line:
-                result['vulnerable'] = True
-                result['summary'] = 'SQL injection vulnerability found'
-                
-            elif '[INFO] no injection point(s) found' in line:
-                result['vulnerable'] = False
-                result['summary'] = 'No SQL injection vulnerabilities found'
-                
-            elif '[CRITICAL] all tested parameters appear to be not injectable' in line:
-                result['vulnerable'] = False
-                result['summary'] = 'No SQL injection vulnerabilities found'
-                
-            elif '[INFO] sqlmap got a connection to the target URL' in line:
-                result['summary'] = 'Successfully connected to target'
-                
-            # Additional vulnerability indicators
-            elif '[INFO] confirming that the parameter' in line and 'is injectable' in line:
-                result['vulnerable'] = True
-                
-            elif '[INFO] parameter' in line and 'is vulnerable' in line:
-                result['vulnerable'] = True
-                
-            elif '[INFO] found a total of' in line and 'injection point(s)' in line:
-                result['vulnerable'] = True
-                
         # Update result with parsed information
+        result.update(state['result'])
         result['vulnerabilities'] = vulnerabilities
-        result['database_info'] = database_info
-        
-        # Fallback: Extract target from command if not found in output
-        if result['target'] == 'Unknown' and self.command:
-            for arg in self.command:
-                if arg.startswith('http://') or arg.startswith('https://'):
-                    result['target'] = arg
-                    break
-                elif arg == '-u' and len(self.command) > self.command.index(arg) + 1:
-                    result['target'] = self.command[self.command.index(arg) + 1]
-                    break
+        result['database_info'] = state['database_info']
         
         # Update summary if we found vulnerabilities
         if result['vulnerable']:
@@ -338,12 +506,40 @@ class RestApiClient(QObject):
     task_failed = Signal(str, str)
     output_received = Signal(str, str)
     
+    # Seconds to wait for the API server to answer a request
+    REQUEST_TIMEOUT = 5
+    
+    # Seconds to wait for a test connection, and for the server to start
+    CONNECT_TIMEOUT = 0.5
+    START_TIMEOUT = 5.0
+    
     def __init__(self, api_url: str = "http://127.0.0.1:8775"):
         super().__init__()
         self.api_url = api_url
-        self.session = None
+        self.session = None  # Created on first request, see _get_session
         self.tasks = {}
         
+    def _get_session(self):
+        """
+        Get the HTTP session shared by all API requests
+        
+        Reusing one session keeps connections to the API server open between
+        requests instead of connecting again for every call.
+        
+        Returns:
+            requests.Session: Session with a connection pool for the server
+        """
+        if self.session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            self.session.mount('http://', adapter)
+            self.session.mount('https://', adapter)
+            
+        return self.session
+        
     def start_api_server(self) -> bool:
         """
         Start sqlmap API server
@@ -359,11 +555,17 @@ class RestApiClient(QObject):
                 stderr=subprocess.PIPE
             )
             
-            # Wait for server to start
-            time.sleep(2)
-            
-            # Test connection
-            return self.test_connection()
+            # Wait for server to start, returning as soon as it answers
+            deadline = time.monotonic() + self.START_TIMEOUT
+            while time.monotonic() < deadline:
+                if self.test_connection():
+                    return True
+                if self.api_process.poll() is not None:
+                    # Server exited without ever listening
+                    return False
+                time.sleep(0.05)
+                
+            return False
             
         except Exception as e:
             print(f"Failed to start API server: {e}")
@@ -377,8 +579,8 @@ class RestApiClient(QObject):
             bool: True if connected
         """
         try:
-            import requests
-            response = requests.get(f"{self.api_url}/")
+            # Short timeout so a server that is not listening yet fails fast
+            response = self._get_session().get(f"{self.api_url}/", timeout=self.CONNECT_TIMEOUT)
             return response.status_code == 200
         except:
             return False
@@ -395,15 +597,15 @@ class RestApiClient(QObject):
             str: Task ID if successful
         """
         try:
-            import requests
-            
             # Build command
             from sqlmapper.core.command_builder import CommandBuilder
             builder = CommandBuilder()
             command = builder.build_command(target, options)
             
             # Create task
-            response = requests.post(f"{self.api_url}/task/new")
+            response = self._get_session().post(
+                f"{self.api_url}/task/new", timeout=self.REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 task_id = response.json()['taskid']
                 self.tasks[task_id] = {
@@ -431,13 +633,13 @@ class RestApiClient(QObject):
             bool: True if started successfully
         """
         try:
-            import requests
-            
             if task_id not in self.tasks:
                 return False
                 
             # Start task
-            response = requests.post(f"{self.api_url}/scan/{task_id}/start")
+            response = self._get_session().post(
+                f"{self.api_url}/scan/{task_id}/start", timeout=self.REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 self.tasks[task_id]['status'] = 'running'
                 self.task_started.emit(task_id)
@@ -459,9 +661,9 @@ class RestApiClient(QObject):
             dict: Task status
         """
         try:
-            import requests
-            
-            response = requests.get(f"{self.api_url}/scan/{task_id}/status")
+            response = self._get_session().get(
+                f"{self.api_url}/scan/{task_id}/status", timeout=self.REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 return response.json()
                 
@@ -481,9 +683,9 @@ class RestApiClient(QObject):
             str: Task log
         """
         try:
-            import requests
-            
-            response = requests.get(f"{self.api_url}/scan/{task_id}/log")
+            response = self._get_session().get(
+                f"{self.api_url}/scan/{task_id}/log", timeout=self.REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 return response.text
                 
@@ -503,9 +705,9 @@ class RestApiClient(QObject):
             dict: Task data
         """
         try:
-            import requests
-            
-            response = requests.get(f"{self.api_url}/scan/{task_id}/data")
+            response = self._get_session().get(
+                f"{self.api_url}/scan/{task_id}/data", timeout=self.REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 return response.json()
                 
@@ -525,9 +727,9 @@ class RestApiClient(QObject):
             bool: True if stopped successfully
         """
         try:
-            import requests
-            
-            response = requests.post(f"{self.api_url}/scan/{task_id}/stop")
+            response = self._get_session().post(
+                f"{self.api_url}/scan/{task_id}/stop", timeout=self.REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 if task_id in self.tasks:
                     self.tasks[task_id]['status'] = 'stopped'
@@ -549,9 +751,9 @@ class RestApiClient(QObject):
             bool: True if deleted successfully
         """
         try:
-            import requests
-            
-            response = requests.delete(f"{self.api_url}/task/{task_id}/delete")
+            response = self._get_session().delete(
+                f"{self.api_url}/task/{task_id}/delete", timeout=self.REQUEST_TIMEOUT
+            )
             if response.status_code == 200:
                 if task_id in self.tasks:
                     del self.tasks[task_id]
@@ -564,6 +766,10 @@ class RestApiClient(QObject):
         
     def stop_api_server(self):
         """Stop the API server"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+            
         if hasattr(self, 'api_process'):
             self.api_process.terminate()
             try:
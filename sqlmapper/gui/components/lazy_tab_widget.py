@@ -0,0 +1,63 @@
+"""
+Tab widget whose tab contents are built on first use
+"""
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QTabWidget
+from PySide6.QtCore import Slot
+
+
+class LazyTabWidget(QTabWidget):
+    """
+    Tab widget that starts each tab as an empty page and only creates the
+    page's widgets when the tab is first shown, or when they are needed
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tab_builders = {}
+        self.currentChanged.connect(self.materialize_tab)
+    
+    def add_lazy_tab(self, builder, label):
+        """
+        Add an empty tab page whose contents are built on first use
+        
+        Args:
+            builder (callable): Function that creates the tab contents
+            label (str): Tab label
+        
+        Returns:
+            QWidget: The tab page
+        """
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        index = self.addTab(page, label)
+        self._tab_builders[index] = builder
+        
+        # The current tab is on screen, so it is built right away
+        if index == self.currentIndex():
+            self.materialize_tab(index)
+        return page
+    
+    @Slot(int)
+    def materialize_tab(self, index):
+        """
+        Build the contents of a tab if they have not been built yet
+        
+        Args:
+            index (int): Tab index
+        """
+        builder = self._tab_builders.pop(index, None)
+        if builder is not None:
+            # Build the whole tab before the page lays out and repaints once
+            page = self.widget(index)
+            page.setUpdatesEnabled(False)
+            try:
+                page.layout().addWidget(builder())
+            finally:
+                page.setUpdatesEnabled(True)
+    
+    def materialize_all(self):
+        """Build every tab that has not been shown yet"""
+        for index in list(self._tab_builders):
+            self.materialize_tab(index)
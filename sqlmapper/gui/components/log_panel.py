@@ -2,11 +2,13 @@
 Console log panel component
 """
 
+import time
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QTextEdit, QGroupBox, 
+    QWidget, QVBoxLayout, QPlainTextEdit, QGroupBox, 
     QPushButton, QHBoxLayout, QCheckBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot, QTimer
 from PySide6.QtGui import QFont, QTextCursor
 
 
@@ -15,10 +17,24 @@ class LogPanel(QGroupBox):
     Panel for displaying console output from sqlmap
     """
     
+    # How long incoming lines are collected before being written out together
+    FLUSH_INTERVAL_MS = 50
+    
+    # Oldest lines are dropped beyond this many, keeping appends cheap
+    MAX_LINES = 5000
+    
     def __init__(self):
         super().__init__("Console Output")
+        self._pending = []  # Lines waiting for the next flush
+        self._timestamp_second = None  # Second that _timestamp was formatted for
+        self._timestamp = ''
         self.init_ui()
         
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        
     def init_ui(self):
         """Initialize the UI components"""
         layout = QVBoxLayout(self)
@@ -39,16 +55,17 @@ class LogPanel(QGroupBox):
         layout.addLayout(button_layout)
         
         # Text output area
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setFont(QFont("Consolas", 10))
+        self.output_text.setMaximumBlockCount(self.MAX_LINES)
         
         # Set minimum height to make console bigger
         self.output_text.setMinimumHeight(300)
         
         # Set dark theme colors
         self.output_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #ffffff;
                 border: 1px solid #3c3c3c;
@@ -59,31 +76,74 @@ class LogPanel(QGroupBox):
         
         layout.addWidget(self.output_text)
         
+    @Slot(str)
     def append_output(self, text):
         """
         Append text to the output area
         
+        The text is queued and written out with any other lines that arrive
+        within FLUSH_INTERVAL_MS, so a burst of output costs one document
+        update instead of one per line.
+        
         Args:
             text (str): Text to append
         """
-        # Add timestamp
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
+    @Slot(list)
+    def append_lines(self, lines):
+        """
+        Append several lines to the output area
+        
+        Args:
+            lines (list): Lines to append
+        """
+        self._pending.extend(lines)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
+    @Slot()
+    def _flush(self):
+        """Write the queued lines to the output area in one insertion"""
+        if not self._pending:
+            return
+            
+        # Add timestamp, once for the whole batch
+        timestamp = self._current_timestamp()
         
         # Format the text with timestamp
-        formatted_text = f"[{timestamp}] {text}"
+        formatted_text = '\n'.join(f"[{timestamp}] {text}" for text in self._pending)
+        self._pending.clear()
         
         # Append to text area
-        self.output_text.append(formatted_text)
+        self.output_text.appendPlainText(formatted_text)
         
-        # Auto-scroll if enabled
+        # Auto-scroll if enabled, even when the view was scrolled up
         if self.auto_scroll_checkbox.isChecked():
-            cursor = self.output_text.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.output_text.setTextCursor(cursor)
+            self.output_text.moveCursor(QTextCursor.End)
             
+    def _current_timestamp(self):
+        """
+        Get the current time as HH:MM:SS
+        
+        The formatted string is reused until the second changes, since
+        several batches are usually flushed within the same second.
+        
+        Returns:
+            str: Current time
+        """
+        now = int(time.time())
+        if now != self._timestamp_second:
+            self._timestamp_second = now
+            self._timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        return self._timestamp
+        
+    @Slot()
     def clear_output(self):
         """Clear the output area"""
+        self._pending.clear()
         self.output_text.clear()
         
     def get_output(self):
@@ -93,4 +153,5 @@ class LogPanel(QGroupBox):
         Returns:
             str: Current output text
         """
+        self._flush()
         return self.output_text.toPlainText()
@@ -5,10 +5,12 @@ Options panel component
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QSpinBox, QComboBox, QLineEdit, QCheckBox,
-    QTabWidget, QLabel, QSlider
+    QLabel, QSlider
 )
 from PySide6.QtCore import Qt, Signal
 
+from sqlmapper.gui.components.lazy_tab_widget import LazyTabWidget
+
 
 class OptionsPanel(QGroupBox):
     """
@@ -17,6 +19,75 @@ class OptionsPanel(QGroupBox):
     
     profile_selected = Signal(dict)
     
+    # (attribute, label, (minimum, maximum), default, suffix)
+    _GENERAL_SPINBOXES = (
+        ('risk_level', "Risk Level:", (1, 3), 1, None),
+        ('level', "Level:", (1, 5), 1, None),
+        ('threads', "Threads:", (1, 10), 1, None),
+        ('timeout', "Timeout:", (1, 300), 30, " seconds"),
+        ('retries', "Retries:", (0, 10), 3, None),
+    )
+    
+    _OPTIMIZATION_SPINBOXES = (
+        ('tor_port', "Tor Port:", (1, 65535), 9050, None),
+        ('delay', "Delay:", (0, 60), 0, " seconds"),
+    )
+    
+    # Tooltips by widget attribute
+    _TOOLTIPS = {
+        'risk_level': "Risk level (1-3): Higher values test more dangerous payloads",
+        'level': "Level (1-5): Higher values perform more extensive tests",
+        'threads': "Number of concurrent HTTP requests",
+        'timeout': "HTTP request timeout",
+        'retries': "Number of retries for failed requests",
+        'custom_args': (
+            "Enter additional sqlmap command-line arguments separated by spaces. Examples:\n"
+            "--os-shell (get OS shell)\n"
+            "--file-read=/etc/passwd (read file)\n"
+            "--file-write=/tmp/test.txt (write file)\n"
+            "--sql-query='SELECT * FROM users' (custom SQL)"
+        ),
+    }
+    
+    # (technique letter, attribute, label, checked by default)
+    _TECHNIQUE_CHECKBOXES = (
+        ('B', 'technique_b', "Boolean-based blind", True),
+        ('E', 'technique_e', "Error-based", True),
+        ('U', 'technique_u', "Union query-based", True),
+        ('S', 'technique_s', "Stacked queries", False),
+        ('T', 'technique_t', "Time-based blind", True),
+        ('Q', 'technique_q', "Inline queries", False),
+    )
+    
+    # DBMS and OS combo box entries; the first one means no option is passed
+    _DBMS_CHOICES = (
+        "Auto-detect", "MySQL", "PostgreSQL", "Oracle", "Microsoft SQL Server", "SQLite",
+        "Firebird", "Sybase", "SAP MaxDB", "DB2", "Informix", "HSQLDB", "H2", "MonetDB",
+        "Derby", "Vertica", "Mckoi", "Presto", "Altibase", "MimerSQL", "CockroachDB",
+    )
+    _OS_CHOICES = ("Auto-detect", "Windows", "Linux")
+    
+    # Option values for each combo box entry, by index
+    _DBMS_VALUES = tuple(choice.lower() for choice in _DBMS_CHOICES)
+    _OS_VALUES = tuple(choice.lower() for choice in _OS_CHOICES)
+    
+    # (attribute, label); the attribute is also the detection option name
+    _DETECTION_CHECKBOXES = (
+        ('banner', "Retrieve DBMS banner"),
+        ('current_user', "Retrieve current user"),
+        ('current_db', "Retrieve current database"),
+        ('hostname', "Retrieve hostname"),
+        ('is_dba', "Check if current user is DBA"),
+        ('users', "Enumerate DBMS users"),
+        ('passwords', "Enumerate DBMS users password hashes"),
+        ('privileges', "Enumerate DBMS users privileges"),
+        ('roles', "Enumerate DBMS users roles"),
+        ('dbs', "Enumerate databases"),
+        ('tables', "Enumerate tables"),
+        ('columns', "Enumerate columns"),
+        ('schema', "Enumerate DBMS schema"),
+    )
+    
     def __init__(self):
         super().__init__("Scan Options")
         self.init_ui()
@@ -27,89 +98,71 @@ class OptionsPanel(QGroupBox):
         layout = QVBoxLayout(self)
         
         # Create tab widget for different option categories
-        self.tab_widget = QTabWidget()
+        self.tab_widget = LazyTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # General tab
-        self.general_tab = self.create_general_tab()
-        self.tab_widget.addTab(self.general_tab, "General")
-        
-        # Injection tab
-        self.injection_tab = self.create_injection_tab()
-        self.tab_widget.addTab(self.injection_tab, "Injection")
+        # Tabs start as empty pages; each page's widgets are only created
+        # when the tab is first shown, or when the options are needed
+        self._stripped_text = {}  # Stripped text of each line edit, by attribute
+        self.general_tab = self.tab_widget.add_lazy_tab(self.create_general_tab, "General")
+        self.injection_tab = self.tab_widget.add_lazy_tab(self.create_injection_tab, "Injection")
+        self.detection_tab = self.tab_widget.add_lazy_tab(self.create_detection_tab, "Detection")
+        self.optimization_tab = self.tab_widget.add_lazy_tab(self.create_optimization_tab, "Optimization")
+        self.advanced_tab = self.tab_widget.add_lazy_tab(self.create_advanced_tab, "Advanced")
         
-        # Detection tab
-        self.detection_tab = self.create_detection_tab()
-        self.tab_widget.addTab(self.detection_tab, "Detection")
-        
-        # Optimization tab
-        self.optimization_tab = self.create_optimization_tab()
-        self.tab_widget.addTab(self.optimization_tab, "Optimization")
+    def _add_spinbox_row(self, layout, attr, label, value_range, default, suffix):
+        """
+        Add a labelled spin box row and store the spin box as an attribute
+        
+        Args:
+            layout (QVBoxLayout): Layout to add the row to
+            attr (str): Attribute name for the spin box
+            label (str): Row label
+            value_range (tuple): (minimum, maximum) value
+            default (int): Initial value
+            suffix (str): Text shown after the value, or None
+            
+        Returns:
+            QSpinBox: The spin box
+        """
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(QLabel(label))
+        spinbox = QSpinBox()
+        spinbox.setRange(*value_range)
+        spinbox.setValue(default)
+        if suffix:
+            spinbox.setSuffix(suffix)
+        tooltip = self._TOOLTIPS.get(attr)
+        if tooltip:
+            spinbox.setToolTip(tooltip)
+        setattr(self, attr, spinbox)
+        row_layout.addWidget(spinbox)
+        row_layout.addStretch()
+        layout.addLayout(row_layout)
+        return spinbox
+        
+    def _track_stripped_text(self, attr, line_edit):
+        """
+        Keep the stripped text of a line edit in _stripped_text as it changes
         
-        # Advanced tab
-        self.advanced_tab = self.create_advanced_tab()
-        self.tab_widget.addTab(self.advanced_tab, "Advanced")
+        Args:
+            attr (str): Attribute name of the line edit
+            line_edit (QLineEdit): Line edit to track
+        """
+        self._stripped_text[attr] = line_edit.text().strip()
+        line_edit.textChanged.connect(
+            lambda text, attr=attr: self._stripped_text.__setitem__(attr, text.strip())
+        )
         
     def create_general_tab(self):
         """Create the general options tab"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
         
-        # Risk level
-        risk_layout = QHBoxLayout()
-        risk_layout.addWidget(QLabel("Risk Level:"))
-        self.risk_level = QSpinBox()
-        self.risk_level.setRange(1, 3)
-        self.risk_level.setValue(1)
-        self.risk_level.setToolTip("Risk level (1-3): Higher values test more dangerous payloads")
-        risk_layout.addWidget(self.risk_level)
-        risk_layout.addStretch()
-        layout.addLayout(risk_layout)
-        
-        # Level
-        level_layout = QHBoxLayout()
-        level_layout.addWidget(QLabel("Level:"))
-        self.level = QSpinBox()
-        self.level.setRange(1, 5)
-        self.level.setValue(1)
-        self.level.setToolTip("Level (1-5): Higher values perform more extensive tests")
-        level_layout.addWidget(self.level)
-        level_layout.addStretch()
-        layout.addLayout(level_layout)
-        
-        # Threads
-        threads_layout = QHBoxLayout()
-        threads_layout.addWidget(QLabel("Threads:"))
-        self.threads = QSpinBox()
-        self.threads.setRange(1, 10)
-        self.threads.setValue(1)
-        self.threads.setToolTip("Number of concurrent HTTP requests")
-        threads_layout.addWidget(self.threads)
-        threads_layout.addStretch()
-        layout.addLayout(threads_layout)
-        
-        # Timeout
-        timeout_layout = QHBoxLayout()
-        timeout_layout.addWidget(QLabel("Timeout:"))
-        self.timeout = QSpinBox()
-        self.timeout.setRange(1, 300)
-        self.timeout.setValue(30)
-        self.timeout.setSuffix(" seconds")
-        self.timeout.setToolTip("HTTP request timeout")
-        timeout_layout.addWidget(self.timeout)
-        timeout_layout.addStretch()
-        layout.addLayout(timeout_layout)
-        
-        # Retries
-        retries_layout = QHBoxLayout()
-        retries_layout.addWidget(QLabel("Retries:"))
-        self.retries = QSpinBox()
-        self.retries.setRange(0, 10)
-        self.retries.setValue(3)
-        self.retries.setToolTip("Number of retries for failed requests")
-        retries_layout.addWidget(self.retries)
-        retries_layout.addStretch()
-        layout.addLayout(retries_layout)
+        # Risk level, level, threads, timeout and retries
+        self._general_spinboxes = [
+            (row[0], self._add_spinbox_row(layout, *row)) for row in self._GENERAL_SPINBOXES
+        ]
         
         layout.addStretch()
         return widget
@@ -123,35 +176,21 @@ class OptionsPanel(QGroupBox):
         techniques_group = QGroupBox("Injection Techniques")
         techniques_layout = QVBoxLayout(techniques_group)
         
-        self.technique_b = QCheckBox("Boolean-based blind")
-        self.technique_b.setChecked(True)
-        techniques_layout.addWidget(self.technique_b)
-        
-        self.technique_e = QCheckBox("Error-based")
-        self.technique_e.setChecked(True)
-        techniques_layout.addWidget(self.technique_e)
-        
-        self.technique_u = QCheckBox("Union query-based")
-        self.technique_u.setChecked(True)
-        techniques_layout.addWidget(self.technique_u)
-        
-        self.technique_s = QCheckBox("Stacked queries")
-        techniques_layout.addWidget(self.technique_s)
-        
-        self.technique_t = QCheckBox("Time-based blind")
-        self.technique_t.setChecked(True)
-        techniques_layout.addWidget(self.technique_t)
-        
-        self.technique_q = QCheckBox("Inline queries")
-        techniques_layout.addWidget(self.technique_q)
-        
+        self._technique_checkboxes = []
+        for code, attr, label, checked in self._TECHNIQUE_CHECKBOXES:
+            checkbox = QCheckBox(label, techniques_group)
+            checkbox.setChecked(checked)
+            setattr(self, attr, checkbox)
+            self._technique_checkboxes.append((code, checkbox))
+            techniques_layout.addWidget(checkbox)
+            
         layout.addWidget(techniques_group)
         
         # DBMS
         dbms_layout = QHBoxLayout()
         dbms_layout.addWidget(QLabel("DBMS:"))
         self.dbms = QComboBox()
-        self.dbms.addItems(["Auto-detect", "MySQL", "PostgreSQL", "Oracle", "Microsoft SQL Server", "SQLite", "Firebird", "Sybase", "SAP MaxDB", "DB2", "Informix", "HSQLDB", "H2", "MonetDB", "Derby", "Vertica", "Mckoi", "Presto", "Altibase", "MimerSQL", "CockroachDB"])
+        self.dbms.addItems(self._DBMS_CHOICES)
         dbms_layout.addWidget(self.dbms)
         dbms_layout.addStretch()
         layout.addLayout(dbms_layout)
@@ -163,50 +202,37 @@ class OptionsPanel(QGroupBox):
         """Create the detection options tab"""
         widget = QWidget()
         layout = QVBoxLayout(widget)
-        
-        # Detection options
-        self.banner = QCheckBox("Retrieve DBMS banner")
-        layout.addWidget(self.banner)
-        
-        self.current_user = QCheckBox("Retrieve current user")
-        layout.addWidget(self.current_user)
-        
-        self.current_db = QCheckBox("Retrieve current database")
-        layout.addWidget(self.current_db)
-        
-        self.hostname = QCheckBox("Retrieve hostname")
-        layout.addWidget(self.hostname)
-        
-        self.is_dba = QCheckBox("Check if current user is DBA")
-        layout.addWidget(self.is_dba)
-        
-        self.users = QCheckBox("Enumerate DBMS users")
-        layout.addWidget(self.users)
-        
-        self.passwords = QCheckBox("Enumerate DBMS users password hashes")
-        layout.addWidget(self.passwords)
-        
-        self.privileges = QCheckBox("Enumerate DBMS users privileges")
-        layout.addWidget(self.privileges)
-        
-        self.roles = QCheckBox("Enumerate DBMS users roles")
-        layout.addWidget(self.roles)
-        
-        self.dbs = QCheckBox("Enumerate databases")
-        layout.addWidget(self.dbs)
-        
-        self.tables = QCheckBox("Enumerate tables")
-        layout.addWidget(self.tables)
-        
-        self.columns = QCheckBox("Enumerate columns")
-        layout.addWidget(self.columns)
-        
-        self.schema = QCheckBox("Enumerate DBMS schema")
-        layout.addWidget(self.schema)
+        layout.setSpacing(2)
+        
+        # Detection options, parented to the tab as they are constructed.
+        # Each checkbox keeps its bit of _detection_mask in step with its state
+        self._detection_checkboxes = []
+        self._detection_mask = 0
+        for bit, (attr, label) in enumerate(self._DETECTION_CHECKBOXES):
+            checkbox = QCheckBox(label, widget)
+            checkbox.toggled.connect(
+                lambda checked, bit=1 << bit: self._set_detection_bit(bit, checked)
+            )
+            setattr(self, attr, checkbox)
+            self._detection_checkboxes.append((attr, checkbox))
+            layout.addWidget(checkbox)
         
         layout.addStretch()
         return widget
         
+    def _set_detection_bit(self, bit, checked):
+        """
+        Set or clear one detection option in the detection bitmask
+        
+        Args:
+            bit (int): Bit of the detection option
+            checked (bool): Whether the option is selected
+        """
+        if checked:
+            self._detection_mask |= bit
+        else:
+            self._detection_mask &= ~bit
+            
     def create_optimization_tab(self):
         """Create the optimization options tab"""
         widget = QWidget()
@@ -217,6 +243,7 @@ class OptionsPanel(QGroupBox):
         proxy_layout.addWidget(QLabel("Proxy:"))
         self.proxy = QLineEdit()
         self.proxy.setPlaceholderText("http://127.0.0.1:8080")
+        self._track_stripped_text('proxy', self.proxy)
         proxy_layout.addWidget(self.proxy)
         layout.addLayout(proxy_layout)
         
@@ -224,26 +251,9 @@ class OptionsPanel(QGroupBox):
         self.tor = QCheckBox("Use Tor")
         layout.addWidget(self.tor)
         
-        # Tor port
-        tor_port_layout = QHBoxLayout()
-        tor_port_layout.addWidget(QLabel("Tor Port:"))
-        self.tor_port = QSpinBox()
-        self.tor_port.setRange(1, 65535)
-        self.tor_port.setValue(9050)
-        tor_port_layout.addWidget(self.tor_port)
-        tor_port_layout.addStretch()
-        layout.addLayout(tor_port_layout)
-        
-        # Delay
-        delay_layout = QHBoxLayout()
-        delay_layout.addWidget(QLabel("Delay:"))
-        self.delay = QSpinBox()
-        self.delay.setRange(0, 60)
-        self.delay.setValue(0)
-        self.delay.setSuffix(" seconds")
-        delay_layout.addWidget(self.delay)
-        delay_layout.addStretch()
-        layout.addLayout(delay_layout)
+        # Tor port and delay
+        for row in self._OPTIMIZATION_SPINBOXES:
+            self._add_spinbox_row(layout, *row)
         
         # Skip URL encoding
         self.skip_url_encode = QCheckBox("Skip URL encoding")
@@ -266,6 +276,7 @@ class OptionsPanel(QGroupBox):
         tamper_layout.addWidget(QLabel("Tamper Scripts:"))
         self.tamper = QLineEdit()
         self.tamper.setPlaceholderText("space2comment,charencode")
+        self._track_stripped_text('tamper', self.tamper)
         tamper_layout.addWidget(self.tamper)
         layout.addLayout(tamper_layout)
         
@@ -273,7 +284,7 @@ class OptionsPanel(QGroupBox):
         os_layout = QHBoxLayout()
         os_layout.addWidget(QLabel("OS:"))
         self.os = QComboBox()
-        self.os.addItems(["Auto-detect", "Windows", "Linux"])
+        self.os.addItems(self._OS_CHOICES)
         os_layout.addWidget(self.os)
         os_layout.addStretch()
         layout.addLayout(os_layout)
@@ -295,7 +306,8 @@ class OptionsPanel(QGroupBox):
         layout.addWidget(QLabel("Custom Arguments:"))
         self.custom_args = QLineEdit()
         self.custom_args.setPlaceholderText("e.g., --os-shell --file-read=/etc/passwd --file-write=/tmp/test.txt")
-        self.custom_args.setToolTip("Enter additional sqlmap command-line arguments separated by spaces. Examples:\n--os-shell (get OS shell)\n--file-read=/etc/passwd (read file)\n--file-write=/tmp/test.txt (write file)\n--sql-query='SELECT * FROM users' (custom SQL)")
+        self.custom_args.setToolTip(self._TOOLTIPS['custom_args'])
+        self._track_stripped_text('custom_args', self.custom_args)
         layout.addWidget(self.custom_args)
         
         layout.addStretch()
@@ -303,22 +315,24 @@ class OptionsPanel(QGroupBox):
         
     def setup_default_profiles(self):
         """Setup default scan profiles"""
+        # Techniques and detection options are sets, so load_profile can
+        # test each checkbox's membership directly
         self.profiles = {
             "Quick Scan": {
                 "risk_level": 1,
                 "level": 1,
                 "threads": 1,
                 "timeout": 30,
-                "techniques": ["B", "E", "U", "T"],
-                "detection": ["banner", "current_user", "current_db"]
+                "techniques": frozenset("BEUT"),
+                "detection": frozenset({"banner", "current_user", "current_db"})
             },
             "Full Scan": {
                 "risk_level": 3,
                 "level": 5,
                 "threads": 3,
                 "timeout": 60,
-                "techniques": ["B", "E", "U", "S", "T", "Q"],
-                "detection": ["banner", "current_user", "current_db", "hostname", "is_dba", "users", "passwords", "privileges", "roles", "dbs", "tables", "columns", "schema"]
+                "techniques": frozenset("BEUSTQ"),
+                "detection": frozenset({"banner", "current_user", "current_db", "hostname", "is_dba", "users", "passwords", "privileges", "roles", "dbs", "tables", "columns", "schema"})
             },
             "Custom": {}
         }
@@ -327,42 +341,29 @@ class OptionsPanel(QGroupBox):
         """Load a scan profile"""
         if profile_name in self.profiles:
             profile = self.profiles[profile_name]
+            self.tab_widget.materialize_all()
             
-            # Apply profile settings
-            if "risk_level" in profile:
-                self.risk_level.setValue(profile["risk_level"])
-            if "level" in profile:
-                self.level.setValue(profile["level"])
-            if "threads" in profile:
-                self.threads.setValue(profile["threads"])
-            if "timeout" in profile:
-                self.timeout.setValue(profile["timeout"])
-                
-            # Apply techniques
-            if "techniques" in profile:
-                self.technique_b.setChecked("B" in profile["techniques"])
-                self.technique_e.setChecked("E" in profile["techniques"])
-                self.technique_u.setChecked("U" in profile["techniques"])
-                self.technique_s.setChecked("S" in profile["techniques"])
-                self.technique_t.setChecked("T" in profile["techniques"])
-                self.technique_q.setChecked("Q" in profile["techniques"])
-                
-            # Apply detection options
-            if "detection" in profile:
-                detection_opts = profile["detection"]
-                self.banner.setChecked("banner" in detection_opts)
-                self.current_user.setChecked("current_user" in detection_opts)
-                self.current_db.setChecked("current_db" in detection_opts)
-                self.hostname.setChecked("hostname" in detection_opts)
-                self.is_dba.setChecked("is_dba" in detection_opts)
-                self.users.setChecked("users" in detection_opts)
-                self.passwords.setChecked("passwords" in detection_opts)
-                self.privileges.setChecked("privileges" in detection_opts)
-                self.roles.setChecked("roles" in detection_opts)
-                self.dbs.setChecked("dbs" in detection_opts)
-                self.tables.setChecked("tables" in detection_opts)
-                self.columns.setChecked("columns" in detection_opts)
-                self.schema.setChecked("schema" in detection_opts)
+            # Apply everything before the panel repaints once
+            self.setUpdatesEnabled(False)
+            try:
+                # Apply profile settings
+                for attr, spinbox in self._general_spinboxes:
+                    if attr in profile:
+                        spinbox.setValue(profile[attr])
+                        
+                # Apply techniques
+                if "techniques" in profile:
+                    techniques = profile["techniques"]
+                    for code, checkbox in self._technique_checkboxes:
+                        checkbox.setChecked(code in techniques)
+                        
+                # Apply detection options
+                if "detection" in profile:
+                    detection_opts = profile["detection"]
+                    for attr, checkbox in self._detection_checkboxes:
+                        checkbox.setChecked(attr in detection_opts)
+            finally:
+                self.setUpdatesEnabled(True)
                 
     def get_options(self):
         """
@@ -371,68 +372,31 @@ class OptionsPanel(QGroupBox):
         Returns:
             dict: Options dictionary
         """
-        options = {}
+        # Tabs never shown still hold the default values
+        self.tab_widget.materialize_all()
         
         # General options
-        options['risk_level'] = self.risk_level.value()
-        options['level'] = self.level.value()
-        options['threads'] = self.threads.value()
-        options['timeout'] = self.timeout.value()
-        options['retries'] = self.retries.value()
+        options = {attr: spinbox.value() for attr, spinbox in self._general_spinboxes}
         
         # Injection techniques
-        techniques = []
-        if self.technique_b.isChecked():
-            techniques.append('B')
-        if self.technique_e.isChecked():
-            techniques.append('E')
-        if self.technique_u.isChecked():
-            techniques.append('U')
-        if self.technique_s.isChecked():
-            techniques.append('S')
-        if self.technique_t.isChecked():
-            techniques.append('T')
-        if self.technique_q.isChecked():
-            techniques.append('Q')
-        options['techniques'] = techniques
+        options['techniques'] = [
+            code for code, checkbox in self._technique_checkboxes if checkbox.isChecked()
+        ]
         
         # DBMS
-        dbms = self.dbms.currentText()
-        if dbms != "Auto-detect":
-            options['dbms'] = dbms.lower()
+        dbms_index = self.dbms.currentIndex()
+        if dbms_index > 0:
+            options['dbms'] = self._DBMS_VALUES[dbms_index]
             
         # Detection options
-        detection = []
-        if self.banner.isChecked():
-            detection.append('banner')
-        if self.current_user.isChecked():
-            detection.append('current_user')
-        if self.current_db.isChecked():
-            detection.append('current_db')
-        if self.hostname.isChecked():
-            detection.append('hostname')
-        if self.is_dba.isChecked():
-            detection.append('is_dba')
-        if self.users.isChecked():
-            detection.append('users')
-        if self.passwords.isChecked():
-            detection.append('passwords')
-        if self.privileges.isChecked():
-            detection.append('privileges')
-        if self.roles.isChecked():
-            detection.append('roles')
-        if self.dbs.isChecked():
-            detection.append('dbs')
-        if self.tables.isChecked():
-            detection.append('tables')
-        if self.columns.isChecked():
-            detection.append('columns')
-        if self.schema.isChecked():
-            detection.append('schema')
-        options['detection'] = detection
+        mask = self._detection_mask
+        options['detection'] = [
+            attr for bit, (attr, _) in enumerate(self._DETECTION_CHECKBOXES) if mask >> bit & 1
+        ]
         
         # Optimization options
-        proxy = self.proxy.text().strip()
+        stripped_text = self._stripped_text
+        proxy = stripped_text['proxy']
         if proxy:
             options['proxy'] = proxy
             
@@ -445,20 +409,20 @@ class OptionsPanel(QGroupBox):
         options['skip_static'] = self.skip_static.isChecked()
         
         # Advanced options
-        tamper = self.tamper.text().strip()
+        tamper = stripped_text['tamper']
         if tamper:
             options['tamper'] = tamper
             
-        os = self.os.currentText()
-        if os != "Auto-detect":
-            options['os'] = os.lower()
+        os_index = self.os.currentIndex()
+        if os_index > 0:
+            options['os'] = self._OS_VALUES[os_index]
             
         options['batch'] = self.batch.isChecked()
         options['no_check'] = self.no_check.isChecked()
         options['fresh_queries'] = self.fresh_queries.isChecked()
         
         # Custom arguments
-        custom_args = self.custom_args.text().strip()
+        custom_args = stripped_text['custom_args']
         if custom_args:
             options['custom_args'] = custom_args
         
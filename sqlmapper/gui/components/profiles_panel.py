@@ -4,12 +4,9 @@ Profiles panel component
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QPushButton, QListWidget, QListWidgetItem,
-    QDialog, QLineEdit, QDialogButtonBox,
-    QMessageBox, QInputDialog
+    QPushButton, QListView, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import Qt, Signal, Slot, QModelIndex, QStringListModel
 
 
 class ProfilesPanel(QGroupBox):
@@ -19,8 +16,13 @@ class ProfilesPanel(QGroupBox):
     
     profile_selected = Signal(str)
     
+    # Built-in profiles, in list order; these cannot be edited or deleted
+    _DEFAULT_PROFILES = ("Quick Scan", "Full Scan", "Custom")
+    _DEFAULT_PROFILE_SET = frozenset(_DEFAULT_PROFILES)
+    
     def __init__(self):
         super().__init__("Scan Profiles")
+        self._profile_name_set = set()  # Names in profiles_list, for fast lookups
         self.init_ui()
         self.load_default_profiles()
         
@@ -29,8 +31,13 @@ class ProfilesPanel(QGroupBox):
         layout = QVBoxLayout(self)
         
         # Profiles list
-        self.profiles_list = QListWidget()
-        self.profiles_list.itemClicked.connect(self.on_profile_selected)
+        self._profiles_model = QStringListModel()
+        self.profiles_list = QListView()
+        self.profiles_list.setModel(self._profiles_model)
+        self.profiles_list.setEditTriggers(QListView.NoEditTriggers)
+        # Only an actual change of selection loads a profile; clicking the
+        # selected profile again does nothing
+        self.profiles_list.selectionModel().currentChanged.connect(self.on_profile_selected)
         layout.addWidget(self.profiles_list)
         
         # Control buttons
@@ -53,69 +60,68 @@ class ProfilesPanel(QGroupBox):
         
     def load_default_profiles(self):
         """Load default scan profiles"""
-        default_profiles = [
-            "Quick Scan",
-            "Full Scan",
-            "Custom"
-        ]
-        
-        for profile in default_profiles:
-            item = QListWidgetItem(profile)
-            self.profiles_list.addItem(item)
+        self._profiles_model.setStringList(list(self._DEFAULT_PROFILES))
+        self._profile_name_set.update(self._DEFAULT_PROFILES)
             
         # Select first profile by default
-        if self.profiles_list.count() > 0:
-            self.profiles_list.setCurrentRow(0)
-            self.on_profile_selected(self.profiles_list.item(0))
+        if self._profiles_model.rowCount() > 0:
+            index = self._profiles_model.index(0)
+            self.profiles_list.setCurrentIndex(index)
             
-    def on_profile_selected(self, item):
+    @Slot(QModelIndex, QModelIndex)
+    def on_profile_selected(self, current, previous):
         """Handle profile selection"""
-        if item:
-            profile_name = item.text()
+        if current.isValid():
+            profile_name = self._profiles_model.data(current, Qt.DisplayRole)
             self.profile_selected.emit(profile_name)
             
+    @Slot()
     def create_new_profile(self):
         """Create a new profile"""
-        dialog = ProfileDialog(self)
-        if dialog.exec() == QDialog.Accepted:
+        dialog = _get_profile_dialog_cls()(self)
+        if dialog.exec() == dialog.Accepted:
             profile_name = dialog.get_profile_name()
-            if profile_name and profile_name not in self.get_profile_names():
+            if profile_name and profile_name not in self._profile_name_set:
                 # Add to list
-                item = QListWidgetItem(profile_name)
-                self.profiles_list.addItem(item)
-                self.profiles_list.setCurrentItem(item)
-                self.on_profile_selected(item)
+                row = self._profiles_model.rowCount()
+                self._profiles_model.insertRows(row, 1)
+                index = self._profiles_model.index(row)
+                self._profiles_model.setData(index, profile_name)
+                self._profile_name_set.add(profile_name)
+                self.profiles_list.setCurrentIndex(index)
             else:
                 QMessageBox.warning(self, "Error", "Profile name already exists or is invalid.")
                 
+    @Slot()
     def edit_profile(self):
         """Edit the selected profile"""
-        current_item = self.profiles_list.currentItem()
-        if not current_item:
+        current_index = self.profiles_list.currentIndex()
+        if not current_index.isValid():
             QMessageBox.warning(self, "Error", "Please select a profile to edit.")
             return
             
-        profile_name = current_item.text()
+        profile_name = self._profiles_model.data(current_index, Qt.DisplayRole)
         
         # Check if it's a default profile
-        if profile_name in ["Quick Scan", "Full Scan", "Custom"]:
+        if profile_name in self._DEFAULT_PROFILE_SET:
             QMessageBox.information(self, "Info", "Default profiles cannot be edited.")
             return
             
         # For now, just show a message
         QMessageBox.information(self, "Info", f"Editing profile '{profile_name}' - Feature coming soon!")
         
+    @Slot()
     def delete_profile(self):
         """Delete the selected profile"""
-        current_item = self.profiles_list.currentItem()
-        if not current_item:
+        current_index = self.profiles_list.currentIndex()
+        if not current_index.isValid():
             QMessageBox.warning(self, "Error", "Please select a profile to delete.")
             return
             
-        profile_name = current_item.text()
+        profile_name = self._profiles_model.data(current_index, Qt.DisplayRole)
         
         # Check if it's a default profile
-        if profile_name in ["Quick Scan", "Full Scan", "Custom"]:
+        if profile_name in self._DEFAULT_PROFILE_SET:
             QMessageBox.information(self, "Info", "Default profiles cannot be deleted.")
             return
             
@@ -128,43 +134,69 @@ class ProfilesPanel(QGroupBox):
         )
         
         if reply == QMessageBox.Yes:
-            self.profiles_list.takeItem(self.profiles_list.row(current_item))
+            self._profiles_model.removeRows(current_index.row(), 1)
+            self._profile_name_set.discard(profile_name)
             
     def get_profile_names(self):
         """Get list of all profile names"""
-        names = []
-        for i in range(self.profiles_list.count()):
-            names.append(self.profiles_list.item(i).text())
-        return names
+        return self._profiles_model.stringList()
+
 
+# ProfileDialog is only needed once the user creates a profile, so the class
+# and the dialog widgets it uses are set up on first use (PEP 562)
+_profile_dialog_cls = None
 
-class ProfileDialog(QDialog):
+
+def _get_profile_dialog_cls():
     """
-    Dialog for creating/editing profiles
+    Get the ProfileDialog class, defining it on first call
+    
+    Returns:
+        type: ProfileDialog class
     """
+    global _profile_dialog_cls
     
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("New Profile")
-        self.setModal(True)
-        self.init_ui()
-        
-    def init_ui(self):
-        """Initialize the UI components"""
-        layout = QVBoxLayout(self)
+    if _profile_dialog_cls is None:
+        from PySide6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QLineEdit
         
-        # Profile name input
-        layout.addWidget(QLabel("Profile Name:"))
-        self.name_input = QLineEdit()
-        self.name_input.setPlaceholderText("Enter profile name...")
-        layout.addWidget(self.name_input)
-        
-        # Dialog buttons
-        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        buttons.accepted.connect(self.accept)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        class ProfileDialog(QDialog):
+            """
+            Dialog for creating/editing profiles
+            """
+            
+            def __init__(self, parent=None):
+                super().__init__(parent)
+                self.setWindowTitle("New Profile")
+                self.setModal(True)
+                self.init_ui()
+                
+            def init_ui(self):
+                """Initialize the UI components"""
+                layout = QVBoxLayout(self)
+                
+                # Profile name input
+                layout.addWidget(QLabel("Profile Name:"))
+                self.name_input = QLineEdit()
+                self.name_input.setPlaceholderText("Enter profile name...")
+                layout.addWidget(self.name_input)
+                
+                # Dialog buttons
+                buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+                buttons.accepted.connect(self.accept)
+                buttons.rejected.connect(self.reject)
+                layout.addWidget(buttons)
+                
+            def get_profile_name(self):
+                """Get the profile name"""
+                return self.name_input.text().strip()
+                
+        _profile_dialog_cls = ProfileDialog
         
-    def get_profile_name(self):
-        """Get the profile name"""
-        return self.name_input.text().strip()
+    return _profile_dialog_cls
+
+
+def __getattr__(name):
+    """Resolve ProfileDialog on first access"""
+    if name == "ProfileDialog":
+        return _get_profile_dialog_cls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,45 +4,290 @@ Results panel component
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-    QTextEdit, QLabel, QTreeWidget, QTreeWidgetItem,
-    QTabWidget, QTableWidget, QTableWidgetItem
+    QTextEdit, QPlainTextEdit, QLabel, QTreeView,
+    QTableView, QHeaderView
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractItemModel, QAbstractTableModel, QModelIndex, QTimer, Slot
 from PySide6.QtGui import QFont
 
+from sqlmapper.gui.components.lazy_tab_widget import LazyTabWidget
+
+
+class VulnerabilityModel(QAbstractTableModel):
+    """
+    Table model over the vulnerabilities found by a scan
+    """
+    
+    # (vulnerability key, column header)
+    COLUMNS = (
+        ('parameter', "Parameter"),
+        ('type', "Type"),
+        ('title', "Title"),
+        ('payload', "Payload"),
+    )
+    _KEYS = tuple(key for key, _ in COLUMNS)
+    _TEXT_ROLES = frozenset((Qt.DisplayRole, Qt.ToolTipRole))
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        
+    def set_vulnerabilities(self, vulnerabilities):
+        """
+        Replace the vulnerabilities shown by the model
+        
+        Rows present before and after keep their place in the view and are
+        only repainted; just the rows added or dropped are inserted or removed.
+        
+        Args:
+            vulnerabilities (list): Vulnerability dicts, used as-is
+        """
+        old_count = len(self._rows)
+        new_count = len(vulnerabilities)
+        
+        if new_count < old_count:
+            self.beginRemoveRows(QModelIndex(), new_count, old_count - 1)
+            self._rows = vulnerabilities
+            self.endRemoveRows()
+        elif new_count > old_count:
+            self.beginInsertRows(QModelIndex(), old_count, new_count - 1)
+            self._rows = vulnerabilities
+            self.endInsertRows()
+        else:
+            self._rows = vulnerabilities
+            
+        kept = min(old_count, new_count)
+        if kept:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(kept - 1, len(self.COLUMNS) - 1), [Qt.DisplayRole]
+            )
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Number of vulnerabilities"""
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns"""
+        return 0 if parent.isValid() else len(self.COLUMNS)
+        
+    def data(self, index, role=Qt.DisplayRole):
+        """Text of a cell; the full text is also its tooltip, since long text is elided"""
+        if role in self._TEXT_ROLES and index.isValid():
+            return self._rows[index.row()].get(self._KEYS[index.column()], '')
+        return None
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column header text"""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][1]
+        return super().headerData(section, orientation, role)
+
+
+class _DatabaseTreeNode:
+    """
+    Node of the database information tree
+    """
+    
+    __slots__ = ('text', 'parent', 'row', 'children', 'pending', 'enabled')
+    
+    def __init__(self, text, parent=None, pending=None, enabled=True):
+        self.text = text
+        self.parent = parent
+        self.row = len(parent.children) if parent is not None else 0
+        self.children = []
+        self.pending = pending  # Child names not yet fetched into children
+        self.enabled = enabled
+        if parent is not None:
+            parent.children.append(self)
+
+
+class DatabaseInfoModel(QAbstractItemModel):
+    """
+    Tree model over the database information found by a scan
+    
+    The table names under each database are only turned into rows when
+    that database's tables are first expanded.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._root = _DatabaseTreeNode(None)
+        
+    def set_database_info(self, db_info):
+        """
+        Replace the database information shown by the model
+        
+        Args:
+            db_info (dict): Database information from the scan result, or
+                None to show nothing
+        """
+        self.beginResetModel()
+        self._root = root = _DatabaseTreeNode(None)
+        
+        if db_info:
+            # DBMS info
+            dbms_node = _DatabaseTreeNode("DBMS Information", root)
+            
+            for key, value in db_info.items():
+                if key == 'databases' and isinstance(value, dict):
+                    # Database structure; table lists are used by reference
+                    db_node = _DatabaseTreeNode("Databases", dbms_node)
+                    for db_name, db_data in value.items():
+                        db_name_node = _DatabaseTreeNode(db_name, db_node)
+                        if isinstance(db_data, dict) and 'tables' in db_data:
+                            _DatabaseTreeNode("Tables", db_name_node, pending=db_data['tables'])
+                elif isinstance(value, dict):
+                    # Nested information
+                    nested_node = _DatabaseTreeNode(key, dbms_node)
+                    for nested_key in value:
+                        _DatabaseTreeNode(nested_key, nested_node)
+                else:
+                    # Simple key-value pair
+                    _DatabaseTreeNode(key, dbms_node)
+        elif db_info is not None:
+            # Show message if no database info
+            _DatabaseTreeNode("No database information available", root, enabled=False)
+            
+        self.endResetModel()
+        
+    def _node(self, index):
+        """Node for an index; the invalid index is the root"""
+        return index.internalPointer() if index.isValid() else self._root
+        
+    def index(self, row, column, parent=QModelIndex()):
+        """Index of a child of parent"""
+        children = self._node(parent).children
+        if column == 0 and 0 <= row < len(children):
+            return self.createIndex(row, column, children[row])
+        return QModelIndex()
+        
+    def parent(self, index):
+        """Index of the parent of index"""
+        if index.isValid():
+            parent = index.internalPointer().parent
+            if parent is not self._root:
+                return self.createIndex(parent.row, 0, parent)
+        return QModelIndex()
+        
+    def rowCount(self, parent=QModelIndex()):
+        """Number of children fetched so far"""
+        if parent.column() > 0:
+            return 0
+        return len(self._node(parent).children)
+        
+    def columnCount(self, parent=QModelIndex()):
+        """Number of columns"""
+        return 1
+        
+    def hasChildren(self, parent=QModelIndex()):
+        """Whether parent has children, fetched or not"""
+        node = self._node(parent)
+        return bool(node.children or node.pending)
+        
+    def canFetchMore(self, parent):
+        """Whether parent still has children to fetch"""
+        return bool(self._node(parent).pending)
+        
+    def fetchMore(self, parent):
+        """Turn the pending children of parent into rows"""
+        node = self._node(parent)
+        names = node.pending
+        node.pending = None
+        if names:
+            self.beginInsertRows(parent, 0, len(names) - 1)
+            for name in names:
+                _DatabaseTreeNode(name, node)
+            self.endInsertRows()
+            
+    def data(self, index, role=Qt.DisplayRole):
+        """Text of a node"""
+        if role == Qt.DisplayRole and index.isValid():
+            return index.internalPointer().text
+        return None
+        
+    def flags(self, index):
+        """Item flags; the no-information message is disabled"""
+        if index.isValid() and not index.internalPointer().enabled:
+            return Qt.NoItemFlags
+        return super().flags(index)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Column header text"""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section == 0:
+            return "Database Information"
+        return super().headerData(section, orientation, role)
+
 
 class ResultsPanel(QGroupBox):
     """
     Panel for displaying scan results
     """
     
+    # Text and style sheet of the vulnerable label, by whether the target is vulnerable
+    _VULNERABLE_LABELS = {
+        True: ("Vulnerable: Yes", "QLabel { color: #4CAF50; font-weight: bold; }"),
+        False: ("Vulnerable: No", "QLabel { color: #f44336; }"),
+    }
+    
+    # Widths of the Parameter, Type and Title columns; Payload takes the rest
+    VULNERABILITY_COLUMN_WIDTHS = (100, 140, 260)
+    
+    # Rows measured when fitting those columns to a scan's vulnerabilities,
+    # and the padding added around the widest text
+    VULNERABILITY_SAMPLE_ROWS = 50
+    VULNERABILITY_COLUMN_PADDING = 16
+    
+    # Those columns grow to at most this many times their default width;
+    # longer text is elided and shown in full in its tooltip
+    VULNERABILITY_MAX_WIDTH_FACTOR = 2
+    
+    # How long results are held before being shown, so that a burst of
+    # updates is shown once with the last of them
+    UPDATE_INTERVAL_MS = 50
+    
+    # Maximum number of lines kept in the raw output view
+    MAX_RAW_LINES = 20000
+    
     def __init__(self):
         super().__init__("Scan Results")
+        self._raw_text = ''  # Raw output currently shown
+        self._raw_streaming = False  # Whether raw output is being streamed in
+        self._column_resize_pending = False
+        self._vulnerable_shown = None  # State shown by vulnerable_label
+        self._pending_result = None  # Result waiting for the next update
         self.init_ui()
         
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._flush_update)
+        
     def init_ui(self):
         """Initialize the UI components"""
         layout = QVBoxLayout(self)
         
         # Create tab widget for different result views
-        self.tab_widget = QTabWidget()
+        self.tab_widget = LazyTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # Summary tab
-        self.summary_tab = self.create_summary_tab()
-        self.tab_widget.addTab(self.summary_tab, "Summary")
-        
-        # Vulnerabilities tab
-        self.vulnerabilities_tab = self.create_vulnerabilities_tab()
-        self.tab_widget.addTab(self.vulnerabilities_tab, "Vulnerabilities")
-        
-        # Database info tab
-        self.database_tab = self.create_database_tab()
-        self.tab_widget.addTab(self.database_tab, "Database")
-        
-        # Raw output tab
-        self.raw_tab = self.create_raw_tab()
-        self.tab_widget.addTab(self.raw_tab, "Raw Output")
+        # Tabs other than the summary are only built when first shown
+        self.summary_tab = self.tab_widget.add_lazy_tab(self.create_summary_tab, "Summary")
+        self.vulnerabilities_tab = self.tab_widget.add_lazy_tab(
+            self.create_vulnerabilities_tab, "Vulnerabilities"
+        )
+        self.database_tab = self.tab_widget.add_lazy_tab(self.create_database_tab, "Database")
+        self.raw_tab = self.tab_widget.add_lazy_tab(self.create_raw_tab, "Raw Output")
+        
+        # Result tabs other than the summary are only filled in while shown;
+        # hidden ones are marked dirty and filled in when next shown
+        self._tab_updaters = {
+            self.vulnerabilities_tab: self.update_vulnerabilities,
+            self.database_tab: self.update_database_info,
+            self.raw_tab: self.update_raw_output,
+        }
+        self._dirty_tabs = set()
+        self._last_result = None  # Result the dirty tabs are waiting for
+        self.tab_widget.currentChanged.connect(self._refresh_tab)
         
     def create_summary_tab(self):
         """Create the summary tab"""
@@ -68,8 +313,8 @@ class ResultsPanel(QGroupBox):
         self.dbms_label = QLabel("DBMS: Unknown")
         status_layout.addWidget(self.dbms_label)
         
-        self.vulnerable_label = QLabel("Vulnerable: No")
-        self.vulnerable_label.setStyleSheet("QLabel { color: #f44336; }")
+        self.vulnerable_label = QLabel()
+        self._set_vulnerable(False)
         status_layout.addWidget(self.vulnerable_label)
         
         layout.addLayout(status_layout)
@@ -83,14 +328,27 @@ class ResultsPanel(QGroupBox):
         layout = QVBoxLayout(widget)
         
         # Vulnerabilities table
-        self.vulnerabilities_table = QTableWidget()
-        self.vulnerabilities_table.setColumnCount(4)
-        self.vulnerabilities_table.setHorizontalHeaderLabels(["Parameter", "Type", "Title", "Payload"])
+        self.vulnerabilities_model = VulnerabilityModel(self)
+        self.vulnerabilities_table = QTableView()
+        self.vulnerabilities_table.setModel(self.vulnerabilities_model)
         
         # Set table properties
         self.vulnerabilities_table.setAlternatingRowColors(True)
-        self.vulnerabilities_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.vulnerabilities_table.horizontalHeader().setStretchLastSection(True)
+        self.vulnerabilities_table.setSelectionBehavior(QTableView.SelectRows)
+        
+        # Long payloads are cut off with an ellipsis rather than wrapped, so
+        # only the visible part of each is laid out
+        self.vulnerabilities_table.setWordWrap(False)
+        self.vulnerabilities_table.setTextElideMode(Qt.ElideRight)
+        
+        # Fixed column widths and row heights, so no cell has to be measured
+        header = self.vulnerabilities_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+        for column, width in enumerate(self.VULNERABILITY_COLUMN_WIDTHS):
+            header.resizeSection(column, width)
+        header.setStretchLastSection(True)
+        self.vulnerabilities_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         
         layout.addWidget(self.vulnerabilities_table)
         
@@ -102,8 +360,10 @@ class ResultsPanel(QGroupBox):
         layout = QVBoxLayout(widget)
         
         # Database info tree
-        self.database_tree = QTreeWidget()
-        self.database_tree.setHeaderLabel("Database Information")
+        self.database_model = DatabaseInfoModel(self)
+        self.database_tree = QTreeView()
+        self.database_tree.setModel(self.database_model)
+        self.database_tree.setUniformRowHeights(True)
         layout.addWidget(self.database_tree)
         
         return widget
@@ -114,13 +374,15 @@ class ResultsPanel(QGroupBox):
         layout = QVBoxLayout(widget)
         
         # Raw output text
-        self.raw_output = QTextEdit()
+        self.raw_output = QPlainTextEdit()
         self.raw_output.setReadOnly(True)
+        self.raw_output.setMaximumBlockCount(self.MAX_RAW_LINES)
+        self.raw_output.setCenterOnScroll(False)
         self.raw_output.setFont(QFont("Consolas", 9))
         
         # Set dark theme colors
         self.raw_output.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: #ffffff;
                 border: 1px solid #3c3c3c;
@@ -138,17 +400,39 @@ class ResultsPanel(QGroupBox):
         Args:
             result (dict): Scan result data
         """
+        self._pending_result = result
+        if not self._update_timer.isActive():
+            self._update_timer.start()
+            
+    @Slot()
+    def _flush_update(self):
+        """Show the most recent result passed to update_results"""
+        self._update_timer.stop()
+        result = self._pending_result
+        if result is None:
+            return
+        self._pending_result = None
+        
         # Update summary
         self.update_summary(result)
         
-        # Update vulnerabilities
-        self.update_vulnerabilities(result)
+        # Update the vulnerabilities, database info and raw output when shown
+        self._last_result = result
+        self._dirty_tabs = set(self._tab_updaters)
+        self._refresh_tab(self.tab_widget.currentIndex())
         
-        # Update database info
-        self.update_database_info(result)
+    @Slot(int)
+    def _refresh_tab(self, index):
+        """
+        Fill in a result tab if it has not been updated since the last result
         
-        # Update raw output
-        self.update_raw_output(result)
+        Args:
+            index (int): Tab index
+        """
+        page = self.tab_widget.widget(index)
+        if page in self._dirty_tabs:
+            self._dirty_tabs.discard(page)
+            self._tab_updaters[page](self._last_result)
         
     def update_summary(self, result):
         """Update the summary tab"""
@@ -162,87 +446,133 @@ class ResultsPanel(QGroupBox):
         dbms = result.get('dbms', 'Unknown')
         self.dbms_label.setText(f"DBMS: {dbms}")
         
-        vulnerable = result.get('vulnerable', False)
-        if vulnerable:
-            self.vulnerable_label.setText("Vulnerable: Yes")
-            self.vulnerable_label.setStyleSheet("QLabel { color: #4CAF50; font-weight: bold; }")
-        else:
-            self.vulnerable_label.setText("Vulnerable: No")
-            self.vulnerable_label.setStyleSheet("QLabel { color: #f44336; }")
+        self._set_vulnerable(bool(result.get('vulnerable', False)))
             
         # Update summary text
         summary_text = result.get('summary', 'No summary available')
         self.summary_text.setPlainText(summary_text)
         
+    def _set_vulnerable(self, vulnerable):
+        """
+        Show whether the target is vulnerable, restyling the label only
+        when that changes
+        
+        Args:
+            vulnerable (bool): Whether the target is vulnerable
+        """
+        if vulnerable != self._vulnerable_shown:
+            self._vulnerable_shown = vulnerable
+            text, style_sheet = self._VULNERABLE_LABELS[vulnerable]
+            self.vulnerable_label.setText(text)
+            self.vulnerable_label.setStyleSheet(style_sheet)
+            
     def update_vulnerabilities(self, result):
         """Update the vulnerabilities tab"""
-        vulnerabilities = result.get('vulnerabilities', [])
-        
-        # Clear existing data
-        self.vulnerabilities_table.setRowCount(len(vulnerabilities))
-        
-        # Populate table
-        for row, vuln in enumerate(vulnerabilities):
-            self.vulnerabilities_table.setItem(row, 0, QTableWidgetItem(vuln.get('parameter', '')))
-            self.vulnerabilities_table.setItem(row, 1, QTableWidgetItem(vuln.get('type', '')))
-            self.vulnerabilities_table.setItem(row, 2, QTableWidgetItem(vuln.get('title', '')))
-            self.vulnerabilities_table.setItem(row, 3, QTableWidgetItem(vuln.get('payload', '')))
+        # Repaint the table once, after all rows have changed
+        table = self.vulnerabilities_table
+        table.setUpdatesEnabled(False)
+        try:
+            self.vulnerabilities_model.set_vulnerabilities(result.get('vulnerabilities', []))
+        finally:
+            table.setUpdatesEnabled(True)
+        
+        # Fit the columns once the current updates are done
+        if not self._column_resize_pending:
+            self._column_resize_pending = True
+            QTimer.singleShot(0, self._resize_vulnerability_columns)
+            
+    def _resize_vulnerability_columns(self):
+        """
+        Fit the fixed-width vulnerability columns to their header and the
+        first VULNERABILITY_SAMPLE_ROWS rows, never below their default width
+        or above VULNERABILITY_MAX_WIDTH_FACTOR times it
+        """
+        self._column_resize_pending = False
+        
+        model = self.vulnerabilities_model
+        header = self.vulnerabilities_table.horizontalHeader()
+        cell_metrics = self.vulnerabilities_table.fontMetrics()
+        header_metrics = header.fontMetrics()
+        rows = min(model.rowCount(), self.VULNERABILITY_SAMPLE_ROWS)
+        
+        for column, default_width in enumerate(self.VULNERABILITY_COLUMN_WIDTHS):
+            text_width = header_metrics.horizontalAdvance(
+                model.headerData(column, Qt.Horizontal)
+            )
+            for row in range(rows):
+                text = model.data(model.index(row, column))
+                text_width = max(text_width, cell_metrics.horizontalAdvance(str(text)))
+            width = max(default_width, text_width + self.VULNERABILITY_COLUMN_PADDING)
+            header.resizeSection(
+                column, min(width, default_width * self.VULNERABILITY_MAX_WIDTH_FACTOR)
+            )
             
-        # Resize columns
-        self.vulnerabilities_table.resizeColumnsToContents()
-        
     def update_database_info(self, result):
         """Update the database information tab"""
-        # Clear existing data
-        self.database_tree.clear()
+        self.database_model.set_database_info(result.get('database_info', {}))
+        
+        # Expand down to the list of databases; the user expands the
+        # databases, and each table list is fetched when first shown
+        self.database_tree.expandToDepth(1)
+        
+    def begin_raw_output(self):
+        """Clear the raw output tab for output streamed in by append_raw_lines"""
+        # A result still waiting belongs to the previous scan, and so does
+        # the raw output it would fill in
+        self._flush_update()
+        self._dirty_tabs.discard(self.raw_tab)
+        self.tab_widget.materialize_tab(self.tab_widget.indexOf(self.raw_tab))
+        self.raw_output.clear()
+        self._raw_text = ''
+        self._raw_streaming = True
         
-        # Add database information
-        db_info = result.get('database_info', {})
+    @Slot(list)
+    def append_raw_lines(self, lines):
+        """
+        Append lines of output to the raw output tab while a scan runs
+        
+        Args:
+            lines (list): Output lines
+        """
+        self.raw_output.appendPlainText('\n'.join(lines))
         
-        if db_info:
-            # DBMS info
-            dbms_item = QTreeWidgetItem(self.database_tree, ["DBMS Information"])
-            
-            for key, value in db_info.items():
-                if key == 'databases' and isinstance(value, dict):
-                    # Database structure
-                    db_item = QTreeWidgetItem(dbms_item, ["Databases"])
-                    for db_name, db_data in value.items():
-                        db_name_item = QTreeWidgetItem(db_item, [db_name])
-                        if isinstance(db_data, dict) and 'tables' in db_data:
-                            tables_item = QTreeWidgetItem(db_name_item, ["Tables"])
-                            for table_name in db_data['tables']:
-                                QTreeWidgetItem(tables_item, [table_name])
-                elif isinstance(value, dict):
-                    # Nested information
-                    nested_item = QTreeWidgetItem(dbms_item, [key])
-                    for nested_key, nested_value in value.items():
-                        QTreeWidgetItem(nested_item, [nested_key, str(nested_value)])
-                else:
-                    # Simple key-value pair
-                    QTreeWidgetItem(dbms_item, [key, str(value)])
-                    
-            # Expand the tree
-            self.database_tree.expandAll()
-        else:
-            # Show message if no database info
-            no_info_item = QTreeWidgetItem(self.database_tree, ["No database information available"])
-            no_info_item.setDisabled(True)
-            
     def update_raw_output(self, result):
         """Update the raw output tab"""
         raw_output = result.get('raw_output', '')
-        self.raw_output.setPlainText(raw_output)
+        shown = self._raw_text
+        
+        if self._raw_streaming:
+            # The output was already appended line by line during the scan
+            self._raw_streaming = False
+        elif shown and raw_output.startswith(shown):
+            # Output continuing what is shown only needs the new part appended
+            added = raw_output[len(shown):].lstrip('\n')
+            if added:
+                self.raw_output.appendPlainText(added)
+        else:
+            self.raw_output.setUpdatesEnabled(False)
+            try:
+                self.raw_output.setPlainText(raw_output)
+            finally:
+                self.raw_output.setUpdatesEnabled(True)
+                
+        self._raw_text = raw_output
         
     def clear_results(self):
         """Clear all results"""
+        self._update_timer.stop()
+        self._pending_result = None
+        self._dirty_tabs.clear()
+        self._last_result = None
+        self.tab_widget.materialize_all()
         self.status_label.setText("Status: Not scanned")
         self.target_label.setText("Target: None")
         self.dbms_label.setText("DBMS: Unknown")
-        self.vulnerable_label.setText("Vulnerable: No")
-        self.vulnerable_label.setStyleSheet("QLabel { color: #f44336; }")
+        self._set_vulnerable(False)
         
         self.summary_text.clear()
-        self.vulnerabilities_table.setRowCount(0)
-        self.database_tree.clear()
+        self.vulnerabilities_model.set_vulnerabilities([])
+        self.database_model.set_database_info(None)
         self.raw_output.clear()
+        self._raw_text = ''
+        self._raw_streaming = False
@@ -2,21 +2,29 @@
 Target input component
 """
 
+import os
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
     QLineEdit, QLabel, QPushButton, QFileDialog,
-    QTextEdit, QTabWidget, QCheckBox
+    QTextEdit, QCheckBox
 )
 from PySide6.QtCore import Qt
 
+from sqlmapper.gui.components.lazy_tab_widget import LazyTabWidget
+
 
 class TargetInput(QGroupBox):
     """
     Component for inputting target information
     """
     
+    # Number of characters of a request file shown in the preview
+    PREVIEW_CHARS = 500
+    
     def __init__(self):
         super().__init__("Target Input")
+        self._preview_cache = None  # ((path, mtime, size), preview) of the last preview
         self.init_ui()
         
     def init_ui(self):
@@ -24,20 +32,14 @@ class TargetInput(QGroupBox):
         layout = QVBoxLayout(self)
         
         # Create tab widget for different input methods
-        self.tab_widget = QTabWidget()
+        self.tab_widget = LazyTabWidget()
         layout.addWidget(self.tab_widget)
         
-        # URL tab
-        self.url_tab = self.create_url_tab()
-        self.tab_widget.addTab(self.url_tab, "URL")
-        
-        # Request file tab
-        self.request_tab = self.create_request_tab()
-        self.tab_widget.addTab(self.request_tab, "Request File")
-        
-        # Custom headers tab
-        self.headers_tab = self.create_headers_tab()
-        self.tab_widget.addTab(self.headers_tab, "Headers")
+        # The request file and headers tabs are only built when first shown,
+        # or when the target is read
+        self.url_tab = self.tab_widget.add_lazy_tab(self.create_url_tab, "URL")
+        self.request_tab = self.tab_widget.add_lazy_tab(self.create_request_tab, "Request File")
+        self.headers_tab = self.tab_widget.add_lazy_tab(self.create_headers_tab, "Headers")
         
     def create_url_tab(self):
         """Create the URL input tab"""
@@ -132,9 +134,14 @@ class TargetInput(QGroupBox):
     def preview_request_file(self, file_path):
         """Preview the contents of a request file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.request_preview.setPlainText(content[:500])  # Show first 500 chars
+            # The same unchanged file is not read again
+            stat = os.stat(file_path)
+            key = (file_path, stat.st_mtime_ns, stat.st_size)
+            if self._preview_cache is None or self._preview_cache[0] != key:
+                # Only the characters shown are read
+                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                    self._preview_cache = (key, f.read(self.PREVIEW_CHARS))
+            self.request_preview.setPlainText(self._preview_cache[1])
         except Exception as e:
             self.request_preview.setPlainText(f"Error reading file: {str(e)}")
             
@@ -145,6 +152,7 @@ class TargetInput(QGroupBox):
         Returns:
             dict: Target information
         """
+        self.tab_widget.materialize_all()
         target_info = {}
         
         # Get current tab
@@ -168,10 +176,15 @@ class TargetInput(QGroupBox):
             if request_file:
                 target_info['request_file'] = request_file
                 
-        # Headers (always available)
-        headers_text = self.headers_input.toPlainText().strip()
-        if headers_text:
-            target_info['headers'] = headers_text
+        # Headers (always available), as {name: value}; lines without a
+        # colon are not headers and are left out
+        headers = {}
+        for line in self.headers_input.toPlainText().splitlines():
+            name, separator, value = line.partition(':')
+            if separator and name.strip():
+                headers[name.strip()] = value.strip()
+        if headers:
+            target_info['headers'] = headers
             
         # Random user agent
         if self.random_user_agent.isChecked():
@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QTextEdit, QGroupBox, QLineEdit, QComboBox,
     QStatusBar, QProgressBar, QMessageBox
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QThread, Signal, QSettings
 from PySide6.QtGui import QFont, QIcon
 
 from sqlmapper.gui.components.log_panel import LogPanel
@@ -29,6 +29,7 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.config = Config()
+        self.qsettings = QSettings("sqlmapper", "gui")  # Window state, stored natively
         self.command_builder = CommandBuilder()
         self.subprocess_runner = None
         
@@ -79,19 +80,21 @@ class MainWindow(QMainWindow):
     def set_application_icon(self):
         """Set the application icon"""
         try:
-            from PySide6.QtGui import QIcon, QPixmap
-            from PySide6.QtCore import Qt
+            from PySide6.QtGui import QIcon, QPixmap, QImageReader
+            from PySide6.QtCore import Qt, QSize
             from pathlib import Path
             
             # Try to load PNG icon
             logo_path = Path(__file__).parent.parent / "logo.png"
             if logo_path.exists():
-                # Load PNG image directly
-                pixmap = QPixmap(str(logo_path))
+                reader = QImageReader(str(logo_path))
                 
-                # Scale to appropriate size if needed
-                if pixmap.width() > 64 or pixmap.height() > 64:
-                    pixmap = pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                # Decode oversized images directly at the target size;
+                # images that already fit are used as-is
+                size = reader.size()
+                if size.width() > 64 or size.height() > 64:
+                    reader.setScaledSize(size.scaled(QSize(64, 64), Qt.KeepAspectRatio))
+                pixmap = QPixmap.fromImage(reader.read())
                 
                 # Set icon
                 icon = QIcon(pixmap)
@@ -197,17 +200,14 @@ class MainWindow(QMainWindow):
     def load_settings(self):
         """Load application settings"""
         # Load window geometry
-        geometry = self.config.get('window_geometry')
+        geometry = self.qsettings.value("geometry")
         if geometry:
-            # Convert base64 string back to QByteArray if needed
-            if isinstance(geometry, str):
-                from PySide6.QtCore import QByteArray
-                geometry = QByteArray.fromBase64(geometry.encode('utf-8'))
             self.restoreGeometry(geometry)
             
     def save_settings(self):
         """Save application settings"""
-        self.config.set('window_geometry', self.saveGeometry())
+        self.qsettings.setValue("geometry", self.saveGeometry())
+        self.config.flush()
         
     def show_legal_disclaimer(self):
         """Show legal disclaimer dialog"""
@@ -246,11 +246,13 @@ class MainWindow(QMainWindow):
             
             # Start subprocess runner
             self.subprocess_runner = SubprocessRunner(command)
-            self.subprocess_runner.output_received.connect(self.log_panel.append_output)
+            self.subprocess_runner.output_received.connect(self.log_panel.append_lines)
+            self.subprocess_runner.output_received.connect(self.results_panel.append_raw_lines)
             self.subprocess_runner.scan_completed.connect(self.on_scan_completed)
             self.subprocess_runner.scan_failed.connect(self.on_scan_failed)
             
             # Update UI
+            self.results_panel.begin_raw_output()
             self.start_button.setEnabled(False)
             self.stop_button.setEnabled(True)
             self.progress_bar.setVisible(True)
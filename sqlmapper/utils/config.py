@@ -2,17 +2,195 @@
 Configuration management for SQLmapper
 """
 
+import atexit
+import copy
 import json
+import operator
 import os
+import re
+import threading
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Config files are read and written as UTF-8 bytes, with orjson when it is
+# installed and the json module otherwise
+if orjson is not None:
+    def _dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Indented JSON for obj"""
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        
+    _loads = orjson.loads
+else:
+    def _dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+        """Indented JSON for obj"""
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=default).encode('utf-8')
+        
+    _loads = json.loads
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Parts of a dot-notation configuration key, split once per key"""
+    return tuple(key.split('.'))
+
+
+@lru_cache(maxsize=128)
+def _key_getter(key: str) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Function looking up a dot-notation key in the config data, built once per key
+    
+    Keys of one or two parts, which is nearly every key, get a function doing
+    the lookups directly; longer keys fall back to walking the parts.
+    Raises KeyError or TypeError when the key is missing.
+    """
+    keys = _split_key(key)
+    if len(keys) == 1:
+        return operator.itemgetter(keys[0])
+    if len(keys) == 2:
+        first, second = keys
+        return lambda config: config[first][second]
+        
+    def getter(config):
+        for k in keys:
+            config = config[k]
+        return config
+    return getter
+
+
+# A base64 encoded QByteArray, as written by _convert_qt_object. Strings are
+# only decoded when long enough and made of base64 characters alone.
+_BASE64_MIN_LENGTH = 100
+_BASE64_RE = re.compile(r'[A-Za-z0-9+/]+={0,2}')
+# Finds, in the raw file, a string that could be one; without a match the
+# loaded config is not walked at all
+_BASE64_CANDIDATE_RE = re.compile(rb'"[A-Za-z0-9+/]{%d,}' % (_BASE64_MIN_LENGTH - 1))
+
+
+def _restore_qbytearray(text: str) -> Any:
+    """QByteArray decoded from base64 text, or the text if Qt is unavailable"""
+    try:
+        from PySide6.QtCore import QByteArray
+    except ImportError:
+        return text
+    return QByteArray.fromBase64(text.encode('ascii'))
+
+
+def _deep_merge(dst: Dict[str, Any], src: Dict[str, Any]):
+    """
+    Merge src into dst in place, merging nested dicts key by key
+    
+    Args:
+        dst (dict): Dict updated with the merged values
+        src (dict): Dict whose values take precedence
+    """
+    stack = [(dst, src)]
+    while stack:
+        d, s = stack.pop()
+        for key, value in s.items():
+            if isinstance(value, dict) and isinstance(d.get(key), dict):
+                stack.append((d[key], value))
+            else:
+                d[key] = value
+
+
+# Directories already created by _ensure_dir in this process
+_dirs_created = set()
+
+
+def _ensure_dir(directory: Path):
+    """Create a config directory, once per process"""
+    if directory not in _dirs_created:
+        directory.mkdir(exist_ok=True)
+        _dirs_created.add(directory)
+
+
+# Configuration used when there is no config file. Never modified; callers
+# that may change it get a copy from Config.get_default_config.
+_DEFAULT_CONFIG = {
+    'last_target': '',
+    'last_profile': 'Quick Scan',
+    'sqlmap_path': 'sqlmap',
+    'api_url': 'http://127.0.0.1:8775',
+    'default_options': {
+        'risk_level': 1,
+        'level': 1,
+        'threads': 1,
+        'timeout': 30,
+        'retries': 3,
+        'batch': True
+    },
+    'profiles': {
+        'Quick Scan': {
+            'risk_level': 1,
+            'level': 1,
+            'threads': 1,
+            'timeout': 30,
+            'techniques': ['B', 'E', 'U', 'T'],
+            'detection': ['banner', 'current_user', 'current_db']
+        },
+        'Full Scan': {
+            'risk_level': 3,
+            'level': 5,
+            'threads': 3,
+            'timeout': 60,
+            'techniques': ['B', 'E', 'U', 'S', 'T', 'Q'],
+            'detection': ['banner', 'current_user', 'current_db', 'hostname', 'is_dba', 'users', 'passwords', 'privileges', 'roles', 'dbs', 'tables', 'columns', 'schema']
+        }
+    },
+    'recent_targets': [],
+    'settings': {
+        'auto_save': True,
+        'show_legal_disclaimer': True,
+        'log_level': 'INFO',
+        'max_history_items': 100
+    }
+}
+
+
+# Configs with changes not yet written, saved when the interpreter exits
+_unsaved_configs = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_unsaved_configs():
+    """Write out every config that still has unsaved changes"""
+    for config in list(_unsaved_configs):
+        config.flush()
 
 
 class Config:
     """
     Configuration manager for SQLmapper
+    
+    Changes are written to disk in batches: each change restarts a short
+    timer, and the file is saved once the changes stop for SAVE_DELAY
+    seconds, on flush(), at the end of a batch() block, or at exit.
     """
     
+    # Seconds without further changes before they are written out
+    SAVE_DELAY = 0.25
+    
+    # Scan history is appended to this file next to the config file, one
+    # JSON record per line, and compacted back to max_history_items entries
+    # once it holds HISTORY_COMPACT_FACTOR times that many
+    HISTORY_FILE_NAME = 'scan_history.jsonl'
+    HISTORY_COMPACT_FACTOR = 2
+    
+    # Number of targets kept in recent_targets
+    MAX_RECENT_TARGETS = 10
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize configuration manager
@@ -22,13 +200,36 @@ class Config:
         """
         if config_file is None:
             # Use default config file in user's home directory
+            # (the directory is created on first save)
             home_dir = Path.home()
-            config_dir = home_dir / '.sqlmapper'
-            config_dir.mkdir(exist_ok=True)
-            config_file = config_dir / 'config.json'
+            config_file = home_dir / '.sqlmapper' / 'config.json'
             
         self.config_file = Path(config_file)
-        self.config_data = self.load_config()
+        self.history_file = self.config_file.with_name(self.HISTORY_FILE_NAME)
+        self._history_lines = None  # Records in history_file, counted on first append
+        self._lock = threading.RLock()  # Guards config_data against the save timer
+        self._dirty = False
+        self._save_timer = None
+        self._batch_depth = 0
+        self._config_data = None  # Loaded on first access to config_data
+        # settings.auto_save and settings.max_history_items, kept in step by
+        # _update_cached_settings
+        self._auto_save = True
+        self._max_history = 100
+        
+    @property
+    def config_data(self) -> Dict[str, Any]:
+        """Configuration data, read from the file the first time it is needed"""
+        if self._config_data is None:
+            with self._lock:
+                if self._config_data is None:
+                    self._config_data = self.load_config()
+                    self._update_cached_settings()
+        return self._config_data
+        
+    @config_data.setter
+    def config_data(self, config_data: Dict[str, Any]):
+        self._config_data = config_data
         
     def load_config(self) -> Dict[str, Any]:
         """
@@ -37,102 +238,140 @@ class Config:
         Returns:
             dict: Configuration data
         """
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                    return self._restore_qt_objects(config_data)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading config: {e}")
-                return self.get_default_config()
-        else:
+        # A missing file is found by the read itself rather than a separate check
+        try:
+            raw = self.config_file.read_bytes()
+            config_data = _loads(raw)
+        except FileNotFoundError:
+            return self.get_default_config()
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading config: {e}")
             return self.get_default_config()
             
+        if _BASE64_CANDIDATE_RE.search(raw):
+            config_data = self._restore_qt_objects(config_data)
+        return config_data
+            
     def _restore_qt_objects(self, obj):
-        """Restore Qt objects from JSON-serialized data"""
-        if isinstance(obj, str) and len(obj) > 100:  # Likely a base64 encoded QByteArray
-            try:
-                from PySide6.QtCore import QByteArray
-                return QByteArray.fromBase64(obj.encode('utf-8'))
-            except:
-                return obj
-        elif isinstance(obj, dict):
-            return {k: self._restore_qt_objects(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._restore_qt_objects(item) for item in obj]
-        else:
-            return obj
+        """
+        Restore Qt objects from JSON-serialized data
+        
+        Dicts and lists are updated in place, walking them with a stack
+        rather than rebuilding every container.
+        """
+        if not isinstance(obj, (dict, list)):
+            return self._restore_qt_objects([obj])[0]
+            
+        stack = [obj]
+        while stack:
+            node = stack.pop()
+            for key, value in (node.items() if isinstance(node, dict) else enumerate(node)):
+                if isinstance(value, (dict, list)):
+                    stack.append(value)
+                elif (isinstance(value, str) and len(value) > _BASE64_MIN_LENGTH
+                        and _BASE64_RE.fullmatch(value)):
+                    node[key] = _restore_qbytearray(value)
+        return obj
             
     def save_config(self):
         """Save configuration to file"""
+        with self._lock:
+            self._cancel_save_timer()
+            
+            try:
+                _ensure_dir(self.config_file.parent)
+                
+                # Written to a temporary file that replaces the config only
+                # once complete and on disk, so a reader or a crash never
+                # sees a partly written config.
+                # QByteArrays are written as base64 strings by the default hook.
+                temp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+                with open(temp_file, 'wb') as f:
+                    f.write(_dumps(self.config_data, default=self._convert_qt_object))
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.config_file)
+            except Exception as e:
+                # Still unsaved, so the next flush or the exit hook tries again
+                self._dirty = True
+                _unsaved_configs.add(self)
+                print(f"Error saving config: {e}")
+                return
+                
+            self._dirty = False
+            _unsaved_configs.discard(self)
+            
+    def flush(self):
+        """Write out changes that have not been saved yet"""
+        with self._lock:
+            if self._dirty:
+                self.save_config()
+                
+    @contextmanager
+    def batch(self):
+        """
+        Hold back saving while the block runs, then save all its changes once
+        
+        Example:
+            with config.batch():
+                config.set('last_target', target)
+                config.add_recent_target(target)
+        """
+        with self._lock:
+            self._batch_depth += 1
         try:
-            # Convert QByteArray to base64 string for JSON serialization
-            config_to_save = self._convert_qt_objects(self.config_data)
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
+                    
+    def _schedule_save(self):
+        """Mark the config changed and (re)start the timer that saves it"""
+        with self._lock:
+            self._dirty = True
+            _unsaved_configs.add(self)
+            if self._batch_depth:
+                return
+                
+            self._cancel_save_timer()
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_to_save, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"Error saving config: {e}")
+    def _cancel_save_timer(self):
+        """Stop a pending save timer, if any"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
             
-    def _convert_qt_objects(self, obj):
-        """Convert Qt objects to JSON-serializable objects"""
+    @staticmethod
+    def _convert_qt_object(obj):
+        """
+        Convert a Qt object to a JSON-serializable object
+        
+        Used as the JSON encoder's default hook, so it is only called for values
+        json cannot serialize itself, and the config is never copied.
+        """
         if hasattr(obj, 'toBase64'):  # QByteArray
             return obj.toBase64().data().decode('utf-8')
-        elif isinstance(obj, dict):
-            return {k: self._convert_qt_objects(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_qt_objects(item) for item in obj]
-        else:
-            return obj
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
             
     def get_default_config(self) -> Dict[str, Any]:
         """
         Get default configuration
         
         Returns:
-            dict: Default configuration
-        """
-        return {
-            'window_geometry': None,
-            'last_target': '',
-            'last_profile': 'Quick Scan',
-            'sqlmap_path': 'sqlmap',
-            'api_url': 'http://127.0.0.1:8775',
-            'default_options': {
-                'risk_level': 1,
-                'level': 1,
-                'threads': 1,
-                'timeout': 30,
-                'retries': 3,
-                'batch': True
-            },
-            'profiles': {
-                'Quick Scan': {
-                    'risk_level': 1,
-                    'level': 1,
-                    'threads': 1,
-                    'timeout': 30,
-                    'techniques': ['B', 'E', 'U', 'T'],
-                    'detection': ['banner', 'current_user', 'current_db']
-                },
-                'Full Scan': {
-                    'risk_level': 3,
-                    'level': 5,
-                    'threads': 3,
-                    'timeout': 60,
-                    'techniques': ['B', 'E', 'U', 'S', 'T', 'Q'],
-                    'detection': ['banner', 'current_user', 'current_db', 'hostname', 'is_dba', 'users', 'passwords', 'privileges', 'roles', 'dbs', 'tables', 'columns', 'schema']
-                }
-            },
-            'scan_history': [],
-            'recent_targets': [],
-            'settings': {
-                'auto_save': True,
-                'show_legal_disclaimer': True,
-                'log_level': 'INFO',
-                'max_history_items': 100
-            }
-        }
+            dict: A new copy of the default configuration
+        """
+        return copy.deepcopy(_DEFAULT_CONFIG)
+        
+    def _update_cached_settings(self):
+        """Re-read the cached settings after the settings may have changed"""
+        defaults = _DEFAULT_CONFIG['settings']
+        self._auto_save = self.get('settings.auto_save', defaults['auto_save'])
+        self._max_history = self.get('settings.max_history_items', defaults['max_history_items'])
         
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -145,13 +384,8 @@ class Config:
         Returns:
             Any: Configuration value
         """
-        keys = key.split('.')
-        value = self.config_data
-        
         try:
-            for k in keys:
-                value = value[k]
-            return value
+            return _key_getter(key)(self.config_data)
         except (KeyError, TypeError):
             return default
             
@@ -163,21 +397,23 @@ class Config:
             key (str): Configuration key (supports dot notation)
             value: Value to set
         """
-        keys = key.split('.')
-        config = self.config_data
+        keys = _split_key(key)
         
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if k not in config:
-                config[k] = {}
-            config = config[k]
+        with self._lock:
+            config = self.config_data
             
-        # Set the value
-        config[keys[-1]] = value
-        
-        # Auto-save if enabled
-        if self.get('settings.auto_save', True):
-            self.save_config()
+            # Navigate to the parent of the target key
+            for k in keys[:-1]:
+                config = config.setdefault(k, {})
+                
+            # Set the value
+            config[keys[-1]] = value
+            if keys[0] == 'settings':
+                self._update_cached_settings()
+                
+            # Auto-save if enabled
+            if self._auto_save:
+                self._schedule_save()
             
     def has(self, key: str) -> bool:
         """
@@ -189,12 +425,8 @@ class Config:
         Returns:
             bool: True if key exists
         """
-        keys = key.split('.')
-        value = self.config_data
-        
         try:
-            for k in keys:
-                value = value[k]
+            _key_getter(key)(self.config_data)
             return True
         except (KeyError, TypeError):
             return False
@@ -206,19 +438,23 @@ class Config:
         Args:
             key (str): Configuration key
         """
-        keys = key.split('.')
-        config = self.config_data
+        keys = _split_key(key)
         
-        # Navigate to the parent of the target key
-        for k in keys[:-1]:
-            if k not in config:
-                return
-            config = config[k]
+        with self._lock:
+            config = self.config_data
             
-        # Delete the key
-        if keys[-1] in config:
-            del config[keys[-1]]
-            self.save_config()
+            # Navigate to the parent of the target key
+            for k in keys[:-1]:
+                if k not in config:
+                    return
+                config = config[k]
+                
+            # Delete the key
+            if keys[-1] in config:
+                del config[keys[-1]]
+                if keys[0] == 'settings':
+                    self._update_cached_settings()
+                self._schedule_save()
             
     def add_scan_history(self, scan_data: Dict[str, Any]):
         """
@@ -227,31 +463,119 @@ class Config:
         Args:
             scan_data (dict): Scan data
         """
-        history = self.get('scan_history', [])
-        
         # Add timestamp if not present
         if 'timestamp' not in scan_data:
             from datetime import datetime
             scan_data['timestamp'] = datetime.now().isoformat()
             
-        # Add to beginning of list
-        history.insert(0, scan_data)
+        record = json.dumps(scan_data, ensure_ascii=False, default=self._convert_qt_object)
+        
+        with self._lock:
+            self._migrate_scan_history()
+            max_items = self._max_history
+            
+            # Append the one record rather than rewriting the whole history
+            try:
+                _ensure_dir(self.history_file.parent)
+                with open(self.history_file, 'a', encoding='utf-8') as f:
+                    f.write(record + '\n')
+            except IOError as e:
+                print(f"Error saving scan history: {e}")
+                return
+                
+            if self._history_lines is None:
+                with open(self.history_file, 'rb') as f:
+                    self._history_lines = sum(1 for _ in f)
+            else:
+                self._history_lines += 1
+                
+            # Limit history size
+            if self._history_lines > max_items * self.HISTORY_COMPACT_FACTOR:
+                self._compact_scan_history(max_items)
+                
+    def _read_scan_history(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Read the newest records of the scan history file
+        
+        Args:
+            limit (int): Maximum number of records
+            
+        Returns:
+            list: Scan history items, newest first
+        """
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                lines = deque(f, maxlen=limit)
+        except FileNotFoundError:
+            return []
+        except IOError as e:
+            print(f"Error loading scan history: {e}")
+            return []
+            
+        history = []
+        for line in reversed(lines):
+            try:
+                history.append(json.loads(line))
+            except json.JSONDecodeError:
+                # Incomplete record from an interrupted write
+                continue
+        return history
         
-        # Limit history size
-        max_items = self.get('settings.max_history_items', 100)
-        if len(history) > max_items:
-            history = history[:max_items]
+    def _compact_scan_history(self, max_items: int):
+        """
+        Rewrite the scan history file with only its newest records
+        
+        Args:
+            max_items (int): Number of records to keep
+        """
+        history = self._read_scan_history(max_items)
+        compacted = self.history_file.with_name(self.history_file.name + '.tmp')
+        
+        try:
+            with open(compacted, 'w', encoding='utf-8') as f:
+                f.writelines(
+                    json.dumps(item, ensure_ascii=False) + '\n' for item in reversed(history)
+                )
+            os.replace(compacted, self.history_file)
+            self._history_lines = len(history)
+        except IOError as e:
+            print(f"Error compacting scan history: {e}")
             
-        self.set('scan_history', history)
+    def _migrate_scan_history(self):
+        """Move scan history kept in the config by older versions to the history file"""
+        legacy = self.config_data.get('scan_history')
+        if legacy is None:
+            return
+            
+        if legacy and not self.history_file.exists():
+            try:
+                _ensure_dir(self.history_file.parent)
+                with open(self.history_file, 'w', encoding='utf-8') as f:
+                    f.writelines(
+                        json.dumps(item, ensure_ascii=False, default=self._convert_qt_object) + '\n'
+                        for item in reversed(legacy)
+                    )
+            except IOError as e:
+                print(f"Error saving scan history: {e}")
+                return
+            self._history_lines = len(legacy)
+            
+        self.delete('scan_history')
         
     def get_scan_history(self) -> List[Dict[str, Any]]:
         """
         Get scan history
         
         Returns:
-            list: List of scan history items
+            list: List of scan history items, newest first
         """
-        return self.get('scan_history', [])
+        # Older versions kept the history in the config itself
+        legacy = self.get('scan_history')
+        max_items = self._max_history
+        if legacy is not None and not self.history_file.exists():
+            return legacy[:max_items]
+            
+        return self._read_scan_history(max_items)
         
     def add_recent_target(self, target: str):
         """
@@ -262,18 +586,10 @@ class Config:
         """
         recent = self.get('recent_targets', [])
         
-        # Remove if already exists
-        if target in recent:
-            recent.remove(target)
-            
-        # Add to beginning
-        recent.insert(0, target)
-        
-        # Limit to 10 items
-        if len(recent) > 10:
-            recent = recent[:10]
-            
-        self.set('recent_targets', recent)
+        # Move to the beginning, dropping an earlier copy and the oldest
+        # targets, in a single pass
+        recent = list(dict.fromkeys([target, *recent[:self.MAX_RECENT_TARGETS]]))
+        self.set('recent_targets', recent[:self.MAX_RECENT_TARGETS])
         
     def get_recent_targets(self) -> List[str]:
         """
@@ -292,9 +608,12 @@ class Config:
             name (str): Profile name
             profile_data (dict): Profile data
         """
-        profiles = self.get('profiles', {})
-        profiles[name] = profile_data
-        self.set('profiles', profiles)
+        # The profiles dict is changed in place, so this holds the lock the
+        # save timer serializes the config under
+        with self._lock:
+            profiles = self.get('profiles', {})
+            profiles[name] = profile_data
+            self.set('profiles', profiles)
         
     def get_profile(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -325,16 +644,28 @@ class Config:
         Args:
             name (str): Profile name
         """
-        profiles = self.get('profiles', {})
-        if name in profiles:
-            del profiles[name]
-            self.set('profiles', profiles)
+        with self._lock:
+            profiles = self.get('profiles', {})
+            if name in profiles:
+                del profiles[name]
+                self.set('profiles', profiles)
             
     def reset_to_defaults(self):
         """Reset configuration to defaults"""
         self.config_data = self.get_default_config()
+        self._update_cached_settings()
         self.save_config()
         
+        # The default history is empty
+        with self._lock:
+            try:
+                self.history_file.unlink()
+            except FileNotFoundError:
+                pass
+            except IOError as e:
+                print(f"Error clearing scan history: {e}")
+            self._history_lines = None
+        
     def export_config(self, file_path: str):
         """
         Export configuration to file
@@ -343,8 +674,8 @@ class Config:
             file_path (str): Export file path
         """
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config_data, f, indent=2, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(_dumps(self.config_data, default=self._convert_qt_object))
         except IOError as e:
             print(f"Error exporting config: {e}")
             
@@ -356,12 +687,15 @@ class Config:
             file_path (str): Import file path
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                imported_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                imported_data = _loads(f.read())
                 
-            # Merge with existing config
-            self.config_data.update(imported_data)
-            self.save_config()
+            # Merge with existing config; nested sections such as profiles
+            # keep the entries the import does not mention
+            with self._lock:
+                _deep_merge(self.config_data, imported_data)
+                self._update_cached_settings()
+                self.save_config()
             
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error importing config: {e}")
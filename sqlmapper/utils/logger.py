@@ -2,10 +2,43 @@
 Logging configuration for SQLmapper
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+
+# Formatters shared by every handler set up here
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+_GUI_FORMATTER = logging.Formatter('%(levelname)s: %(message)s')
+
+# Handlers created by setup_logging, reused by later calls
+_console_handler: Optional[logging.Handler] = None
+# Log files are written by a listener thread; each path maps to the
+# QueueHandler added to the logger and the listener that owns the FileHandler
+_file_handlers: Dict[Path, Tuple[QueueHandler, QueueListener]] = {}
+
+
+def _stop_file_handler(queue_handler: QueueHandler, listener: QueueListener):
+    """Write out the queued records and close the log file"""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    queue_handler.close()
+
+
+@atexit.register
+def _stop_file_handlers():
+    """Flush every log file before the interpreter exits"""
+    while _file_handlers:
+        _stop_file_handler(*_file_handlers.popitem()[1])
 
 
 def setup_logging(
@@ -21,35 +54,51 @@ def setup_logging(
         log_file (str): Log file path (optional)
         console_output (bool): Enable console output
     """
+    global _console_handler
+    
     # Create logger
     logger = logging.getLogger('sqlmapper')
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Clear existing handlers
-    logger.handlers.clear()
-    
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    # Handlers from earlier calls are reused, so calling this again does not
+    # reopen the log file
+    handlers = []
     
     # Console handler
     if console_output:
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        if _console_handler is None:
+            _console_handler = logging.StreamHandler(sys.stdout)
+            _console_handler.setFormatter(_FORMATTER)
+        _console_handler.setLevel(logging.INFO)
+        handlers.append(_console_handler)
         
     # File handler
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_path = Path(log_file).resolve()
+        if log_path not in _file_handlers:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            file_handler = logging.FileHandler(log_path)
+            file_handler.setFormatter(_FORMATTER)
+            file_handler.setLevel(logging.DEBUG)
+            
+            # Logging only queues the record; the write happens on the
+            # listener's thread
+            log_queue = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            _file_handlers[log_path] = (QueueHandler(log_queue), listener)
+        queue_handler = _file_handlers[log_path][0]
+        queue_handler.setLevel(logging.DEBUG)
+        handlers.append(queue_handler)
         
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    # Close log files that are no longer used
+    for path, (queue_handler, listener) in list(_file_handlers.items()):
+        if queue_handler not in handlers:
+            del _file_handlers[path]
+            _stop_file_handler(queue_handler, listener)
+            
+    # Replace existing handlers
+    logger.handlers[:] = handlers
         
     # Prevent duplicate logs
     logger.propagate = False
@@ -73,19 +122,66 @@ def get_logger(name: str = 'sqlmapper') -> logging.Logger:
 class LogHandler(logging.Handler):
     """
     Custom log handler for GUI output
+    
+    Messages are collected and passed to the callback together, as one
+    newline-joined string, FLUSH_INTERVAL seconds after the first one or as
+    soon as MAX_BATCH messages are waiting.
+    
+    The callback is called from a timer thread or from the thread that
+    logged, never necessarily the GUI thread, so it must be thread-safe.
+    To update a widget, pass the emit method of a Qt signal connected to it;
+    the connection queues the call onto the widget's thread.
     """
     
+    FLUSH_INTERVAL = 0.05
+    MAX_BATCH = 200
+    
     def __init__(self, callback):
         super().__init__()
         self.callback = callback
+        self._buf = []
+        self._buf_lock = threading.Lock()
+        self._flush_timer = None
+        
+    def handle(self, record):
+        """Handle log record, skipping filters and the lock when it would be dropped"""
+        if record.levelno < self.level or self.callback is None:
+            return False
+        return super().handle(record)
         
     def emit(self, record):
         """Emit log record"""
+        # Records are only formatted when someone receives them
+        if self.callback is None:
+            return
         try:
             msg = self.format(record)
-            self.callback(msg)
+            with self._buf_lock:
+                self._buf.append(msg)
+                if len(self._buf) < self.MAX_BATCH:
+                    if self._flush_timer is None:
+                        self._flush_timer = threading.Timer(self.FLUSH_INTERVAL, self.flush)
+                        self._flush_timer.daemon = True
+                        self._flush_timer.start()
+                    return
+            self.flush()
         except Exception:
             self.handleError(record)
+            
+    def flush(self):
+        """Pass the collected messages to the callback"""
+        with self._buf_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batch, self._buf = self._buf, []
+        if batch and self.callback is not None:
+            self.callback('\n'.join(batch))
+            
+    def close(self):
+        """Deliver the remaining messages and close the handler"""
+        self.flush()
+        super().close()
 
 
 def setup_gui_logging(callback):
@@ -93,7 +189,8 @@ def setup_gui_logging(callback):
     Setup logging for GUI output
     
     Args:
-        callback: Callback function for log messages
+        callback: Thread-safe callback for batches of log messages, such as
+            the emit method of a Qt signal; see LogHandler
     """
     logger = get_logger()
     
@@ -101,10 +198,7 @@ def setup_gui_logging(callback):
     gui_handler = LogHandler(callback)
     gui_handler.setLevel(logging.INFO)
     
-    formatter = logging.Formatter(
-        '%(levelname)s: %(message)s'
-    )
-    gui_handler.setFormatter(formatter)
+    gui_handler.setFormatter(_GUI_FORMATTER)
     
     logger.addHandler(gui_handler)
     
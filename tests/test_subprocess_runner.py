@@ -0,0 +1,47 @@
+"""
+Tests for the sqlmap subprocess runner
+"""
+
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from sqlmapper.core.subprocess_runner import SubprocessRunner
+
+
+# sqlmap redraws "retrieved:" progress lines with a leading carriage return
+SQLMAP_OUTPUT = (
+    "[10:00:00] [INFO] the back-end DBMS is MySQL\n"
+    "[10:00:01] [INFO] fetching current user\n"
+    "\r[10:00:02] [INFO] retrieved: root@localhost\n"
+    "[10:00:03] [INFO] fetching database server version\n"
+    "\r[10:00:04] [INFO] retrieved: 5.7\r\n"
+)
+
+
+def run_with_output(output):
+    """Run a process printing output and return the lines and the result"""
+    script = f"import sys; sys.stdout.write({output!r})"
+    runner = SubprocessRunner([sys.executable, "-c", script])
+    lines = []
+    results = []
+    runner.output_received.connect(lines.extend)
+    runner.scan_completed.connect(results.append)
+    runner.run()
+    assert len(results) == 1
+    return lines, results[0]
+
+
+def test_carriage_return_lines_are_parsed():
+    lines, result = run_with_output(SQLMAP_OUTPUT)
+    
+    assert result['database_info'] == {
+        'dbms': 'MySQL',
+        'current_user': 'root@localhost',
+        'version': '5.7',
+    }
+    assert all('\r' not in line for line in lines)
+    assert "[10:00:02] [INFO] retrieved: root@localhost" in lines
+    assert '\r' not in result['raw_output']